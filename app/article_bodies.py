@@ -0,0 +1,178 @@
+"""사설 본문 수집: 목록 저장 후 n.news.naver.com 기사 페이지를 받아 본문·요약을 채움.
+   워커 수를 제한한 큐로 처리하고, 본문은 URL당 한 번만 받음 (content가 NULL인 것만 대상).
+   받기 실패는 DB에 기록해 간격을 늘려 가며 다시 받음 (지난 날짜는 목록을 다시 수집하지 않으므로).
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+from typing import Iterable
+
+import aiosqlite
+
+from app.database import DB_PATH, record_body_failure, save_article_body, urls_due_for_body
+from app.http_clients import http_session
+from app.parse_executor import parse_executor
+from app.scrapers.base import BROWSER_HEADERS, make_soup
+
+# 동시에 받을 기사 페이지 수
+BODY_FETCH_CONCURRENCY = max(1, int(os.environ.get("BODY_FETCH_CONCURRENCY", "4")))
+BODY_FETCH_TIMEOUT = 15.0
+# 실패한 본문 재시도: 첫 대기(초, 실패할 때마다 두 배), 이 횟수만큼 실패하면 빈 본문으로 확정
+BODY_RETRY_BASE_SECONDS = int(os.environ.get("BODY_RETRY_BASE_SECONDS", "300"))
+BODY_MAX_FAILURES = 5
+# 시작 시와 이 주기(초)마다 DB에서 본문이 없는(재시도 시각이 된) 기사를 최대 BODY_REQUEUE_BATCH개 다시 넣음
+BODY_REQUEUE_INTERVAL_SECONDS = 600
+BODY_REQUEUE_BATCH = 200
+SUMMARY_MAX_CHARS = 300
+# 네이버 뉴스 기사 본문 영역 (신/구 레이아웃)
+BODY_SELECTORS = ("#dic_area", "#newsct_article", "#articleBodyContents", "#articeBody")
+# 본문 안의 사진 설명·스크립트 등 본문이 아닌 요소
+BODY_NOISE_SELECTORS = ("script", "style", ".img_desc", ".end_photo_org", ".vod_player_wrap", ".media_end_summary")
+
+
+def extract_article(html: str) -> tuple[str, str | None]:
+    """기사 HTML → (본문, 요약). 요약은 기사 요약문(있으면) → og:description → 본문 앞부분."""
+    soup = make_soup(html)
+    body_el = None
+    for selector in BODY_SELECTORS:
+        body_el = soup.select_one(selector)
+        if body_el is not None:
+            break
+    summary_el = soup.select_one(".media_end_summary")
+    summary = summary_el.get_text(" ", strip=True) if summary_el is not None else ""
+    content = ""
+    if body_el is not None:
+        for noise in body_el.select(", ".join(BODY_NOISE_SELECTORS)):
+            noise.decompose()
+        lines = [line.strip() for line in body_el.get_text("\n").splitlines()]
+        content = "\n".join(line for line in lines if line)
+    if not summary:
+        og = soup.select_one('meta[property="og:description"]')
+        summary = (og.get("content") or "").strip() if og is not None else ""
+    if not summary and content:
+        summary = content.replace("\n", " ")
+    return content, (summary[:SUMMARY_MAX_CHARS] or None)
+
+
+class BodyFetcher:
+    """본문 수집 큐 + 워커 풀. enqueue는 중복 URL을 무시하고, start 전에 넣은 것도 시작 후 처리."""
+
+    def __init__(self, concurrency: int = BODY_FETCH_CONCURRENCY):
+        self.concurrency = concurrency
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._pending: set[str] = set()
+        self._workers: list[asyncio.Task] = []
+        self._requeue_task: asyncio.Task | None = None
+        self.fetched = 0
+        self.failed = 0
+        self.gave_up = 0
+        self.requeued = 0
+        self.last_error: str | None = None
+
+    @property
+    def running(self) -> bool:
+        return any(not w.done() for w in self._workers)
+
+    def start(self, requeue: bool = True) -> None:
+        """워커 시작. requeue=True면 DB에 남은 본문 없는 기사(이전 실패·종료 전 대기분)도 주기적으로 다시 넣음."""
+        if self.running:
+            return
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        if requeue:
+            self._requeue_task = asyncio.create_task(self._requeue_loop())
+
+    async def stop(self) -> None:
+        tasks, self._workers = self._workers, []
+        if self._requeue_task is not None:
+            tasks.append(self._requeue_task)
+            self._requeue_task = None
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def requeue_due(self) -> int:
+        """재시도 시각이 된 본문 없는 기사를 큐에 추가. 추가한 개수 반환."""
+        async with aiosqlite.connect(DB_PATH) as db:
+            urls = await urls_due_for_body(db, BODY_REQUEUE_BATCH)
+        added = self.enqueue(urls)
+        self.requeued += added
+        return added
+
+    async def _requeue_loop(self) -> None:
+        while True:
+            try:
+                await self.requeue_due()
+            except Exception as e:
+                print(f"[본문 수집] 재시도 목록 조회 실패: {e!r}")
+            await asyncio.sleep(BODY_REQUEUE_INTERVAL_SECONDS)
+
+    def enqueue(self, urls: Iterable[str]) -> int:
+        """네이버 뉴스 기사 URL만 큐에 추가. 추가한 개수 반환."""
+        added = 0
+        for url in urls:
+            if "n.news.naver.com/" not in url or url in self._pending:
+                continue
+            self._pending.add(url)
+            self._queue.put_nowait(url)
+            added += 1
+        return added
+
+    async def join(self) -> None:
+        """큐가 빌 때까지 대기 (backfill CLI 종료 전)."""
+        await self._queue.join()
+
+    async def _worker(self) -> None:
+        while True:
+            url = await self._queue.get()
+            try:
+                await self._fetch_one(url)
+            except Exception as e:
+                self.failed += 1
+                self.last_error = f"{url}: {e!r}"[:200]
+                await self._record_failure(url)
+            finally:
+                self._pending.discard(url)
+                self._queue.task_done()
+
+    async def _fetch_one(self, url: str) -> None:
+        async with http_session(
+            url, headers={**BROWSER_HEADERS, "Referer": "https://news.naver.com/"}, timeout=BODY_FETCH_TIMEOUT
+        ) as client:
+            r = await client.get(url)
+        if 400 <= r.status_code < 500:
+            # 삭제된 기사 등: 빈 본문으로 기록해 다시 받지 않음
+            content, summary = "", None
+        else:
+            r.raise_for_status()
+            content, summary = await parse_executor.run(extract_article, r.text)
+        async with aiosqlite.connect(DB_PATH) as db:
+            await save_article_body(db, url, content, summary)
+        self.fetched += 1
+
+    async def _record_failure(self, url: str) -> None:
+        """실패 횟수를 늘리고 다음 재시도 시각을 기록 (BODY_RETRY_BASE_SECONDS × 2^(실패 횟수-1))."""
+        try:
+            async with aiosqlite.connect(DB_PATH) as db:
+                async with db.execute("SELECT body_failures FROM editorials WHERE url = ?", (url,)) as cur:
+                    row = await cur.fetchone()
+                delay = BODY_RETRY_BASE_SECONDS * 2 ** (row[0] if row else 0)
+                retry_at = (datetime.now() + timedelta(seconds=delay)).isoformat(timespec="seconds")
+                if await record_body_failure(db, url, retry_at, BODY_MAX_FAILURES) >= BODY_MAX_FAILURES:
+                    self.gave_up += 1
+        except Exception as e:
+            print(f"[본문 수집] 실패 기록 오류 {url}: {e!r}")
+
+    def status(self) -> dict:
+        return {
+            "running": self.running,
+            "concurrency": self.concurrency,
+            "queued": self._queue.qsize(),
+            "fetched": self.fetched,
+            "failed": self.failed,
+            "gave_up": self.gave_up,
+            "requeued": self.requeued,
+            "last_error": self.last_error,
+        }
+
+
+body_fetcher = BodyFetcher()
@@ -0,0 +1,186 @@
+"""과거 날짜 사설 일괄 수집(backfill). 날짜마다 기록이 확정되지 않은 스크래퍼만 수집하고, 중단돼도 체크포인트로 이어서 진행.
+   사용: python -m app.backfill --days 90 [--concurrency 2] [--per-minute 6]
+"""
+import argparse
+import asyncio
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+import aiosqlite
+
+from app.database import DB_PATH, get_scrape_log, init_db
+from app.editorial_service import is_final_log, scrape_and_store, scrape_flight
+from app.scrapers import SCRAPERS
+from app.scrapers.base import BaseScraper
+
+CHECKPOINT_PATH = DB_PATH.parent / "backfill_checkpoint.json"
+# 동시에 수집할 날짜 수
+BACKFILL_CONCURRENCY = 2
+# news.naver.com 부하를 줄이기 위한 분당 최대 날짜 수 (날짜 하나 = 사설 탭 + list.naver 여러 페이지)
+BACKFILL_DATES_PER_MINUTE = 6
+
+
+def backfill_dates(days: int) -> List[str]:
+    """어제부터 과거로 days-1일 (오늘은 미리 수집 스케줄러가 담당). /api/dates와 같은 범위."""
+    today = datetime.now().date()
+    return [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(1, days)]
+
+
+class _RateLimiter:
+    """호출 간 최소 간격을 보장 (분당 per_minute회)."""
+
+    def __init__(self, per_minute: int):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            if now < self._next_at:
+                await asyncio.sleep(self._next_at - now)
+                now = time.monotonic()
+            self._next_at = now + self.interval
+
+
+def _load_checkpoint() -> dict:
+    try:
+        with open(CHECKPOINT_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _save_checkpoint(data: dict) -> None:
+    """임시 파일에 쓴 뒤 교체 (쓰는 도중 죽어도 이전 체크포인트 유지)."""
+    CHECKPOINT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = CHECKPOINT_PATH.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, CHECKPOINT_PATH)
+
+
+class Backfill:
+    """날짜 범위를 돌며 기록이 확정되지 않은 스크래퍼만 수집. 완료한 날짜는 체크포인트에 기록."""
+
+    def __init__(
+        self,
+        dates: List[str],
+        scrapers: list[type[BaseScraper]] | None = None,
+        concurrency: int = BACKFILL_CONCURRENCY,
+        per_minute: int = BACKFILL_DATES_PER_MINUTE,
+    ):
+        self.dates = dates
+        self.scrapers = list(scrapers or SCRAPERS)
+        self.concurrency = max(1, concurrency)
+        self._limiter = _RateLimiter(per_minute)
+        self._checkpoint: dict = {}
+        self.done = 0
+        self.skipped = 0
+        # 수집은 끝났지만 0건 재시도가 남아 다음 실행으로 넘긴 날짜 수
+        self.pending = 0
+        self.failed: dict[str, str] = {}
+        self.started_at: str | None = None
+        self.finished_at: str | None = None
+
+    async def _pending_scrapers(self, date: str) -> list[type[BaseScraper]]:
+        """기록이 아직 확정되지 않은 스크래퍼 (기록 없음·오류·재시도할 0건)."""
+        async with aiosqlite.connect(DB_PATH) as db:
+            return [
+                cls for cls in self.scrapers
+                if not is_final_log(await get_scrape_log(db, cls.source_name, date), date)
+            ]
+
+    async def _run_date(self, date: str, sem: asyncio.Semaphore) -> None:
+        async with sem:
+            if date in self._checkpoint["completed"]:
+                self.skipped += 1
+                return
+            to_run = await self._pending_scrapers(date)
+            if not to_run:
+                self.skipped += 1
+                return
+            await self._limiter.wait()
+            errors = []
+            for cls in to_run:
+                _, _, meta = await scrape_flight.do(
+                    (cls.source_name, date), lambda cls=cls: scrape_and_store(cls, date)
+                )
+                if meta.get("error"):
+                    errors.append(f"{cls.source_name}: {meta['error']}")
+            if errors:
+                self.failed[date] = "; ".join(errors)[:300]
+                self._checkpoint["failed"][date] = self.failed[date]
+            elif await self._pending_scrapers(date):
+                # 0건이 아직 확정되지 않음 (EMPTY_PAST_RETRIES) → 실패가 아니라 다음 실행에서 다시 수집
+                self.pending += 1
+                self._checkpoint["failed"].pop(date, None)
+            else:
+                self.done += 1
+                # 사설이 없는 날(일요일 등)도 0건이 확정되면 다시 수집하지 않도록 완료로 기록
+                self._checkpoint["completed"].append(date)
+                self._checkpoint["failed"].pop(date, None)
+            self._checkpoint["updated_at"] = datetime.now().isoformat(timespec="seconds")
+            _save_checkpoint(self._checkpoint)
+
+    async def run(self) -> dict:
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self._checkpoint = _load_checkpoint()
+        self._checkpoint.setdefault("completed", [])
+        self._checkpoint.setdefault("failed", {})
+        sem = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*[self._run_date(d, sem) for d in self.dates])
+        self.finished_at = datetime.now().isoformat(timespec="seconds")
+        return self.status()
+
+    def status(self) -> dict:
+        return {
+            "total": len(self.dates),
+            "done": self.done,
+            "skipped": self.skipped,
+            "pending": self.pending,
+            "failed": dict(self.failed),
+            "remaining": len(self.dates) - self.done - self.skipped - self.pending - len(self.failed),
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+async def _main(args) -> None:
+    from app.article_bodies import body_fetcher
+    from app.http_clients import http_clients
+    from app.parse_executor import parse_executor
+    from app.scrapers.browser import browser_pool
+
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    async with aiosqlite.connect(DB_PATH) as db:
+        await init_db(db)
+    if args.reset and CHECKPOINT_PATH.exists():
+        CHECKPOINT_PATH.unlink()
+    job = Backfill(backfill_dates(args.days), concurrency=args.concurrency, per_minute=args.per_minute)
+    # 이번 실행에서 저장한 날짜의 본문만 받음 (이전 실패분 재시도는 서버의 본문 수집기가 담당)
+    body_fetcher.start(requeue=False)
+    try:
+        status = await job.run()
+        await body_fetcher.join()
+    finally:
+        await body_fetcher.stop()
+        await browser_pool.stop()
+        await http_clients.aclose()
+        parse_executor.stop()
+    print(json.dumps(status, ensure_ascii=False, indent=1))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="과거 날짜 사설 일괄 수집")
+    parser.add_argument("--days", type=int, default=90, help="오늘 기준 최근 N일 (기본 90)")
+    parser.add_argument("--concurrency", type=int, default=BACKFILL_CONCURRENCY, help="동시에 수집할 날짜 수")
+    parser.add_argument("--per-minute", type=int, default=BACKFILL_DATES_PER_MINUTE, help="분당 최대 수집 날짜 수")
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 지우고 처음부터")
+    asyncio.run(_main(parser.parse_args()))
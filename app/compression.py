@@ -0,0 +1,153 @@
+"""응답 압축 (gzip / brotli).
+   Accept-Encoding에 따라 br(brotli 설치 시) → gzip 순으로 고름. 순수 ASGI 미들웨어라 응답 본문을 통째로
+   모으지 않고, 스트리밍 응답(NDJSON 등)은 조각마다 flush해 받는 즉시 풀 수 있게 보냄.
+"""
+import gzip
+import os
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli  # requirements.txt에 포함. 없으면 gzip만
+except ImportError:
+    brotli = None
+
+# 이보다 작은 응답은 압축하지 않음 (헤더·CPU 비용이 더 큼)
+COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", "512"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# 압축 효과가 있는 Content-Type
+COMPRESSIBLE_TYPES = (
+    "text/html", "text/plain", "text/css", "text/xml", "application/json",
+    "application/x-ndjson", "application/javascript", "text/javascript", "application/xml",
+    "image/svg+xml",
+)
+
+
+def pick_encoding(accept_encoding: str, available: tuple[str, ...] = ("br", "gzip")) -> str:
+    """Accept-Encoding에서 사용할 인코딩 (br 우선). q=0은 거부로 처리. 없으면 identity."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if name:
+            accepted.add(name.strip())
+    for encoding in available:
+        if encoding == "br" and brotli is None:
+            continue
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return "identity"
+
+
+def compress_body(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """한 번에 압축. best=True면 최고 압축률 (미리 압축해 두는 본문용)."""
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if best else BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9 if best else GZIP_LEVEL, mtime=0)
+    return body
+
+
+class _StreamCompressor:
+    """스트리밍 응답용: 조각마다 flush해서 클라이언트가 바로 풀 수 있게 함."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._gz = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.flush()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._br.finish()
+        return self._gz.flush(zlib.Z_FINISH)
+
+
+def _is_compressible(content_type: str) -> bool:
+    content_type = content_type.split(";")[0].strip().lower()
+    return content_type in COMPRESSIBLE_TYPES
+
+
+class CompressionMiddleware:
+    """이미 인코딩된 응답(미리 압축한 페이지 등), 304·HEAD, 압축 효과 없는 타입은 그대로 통과."""
+
+    def __init__(self, app, minimum_size: int = COMPRESS_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("method") == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = pick_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor: _StreamCompressor | None = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] in (204, 206, 304)
+                    or "content-encoding" in headers
+                    or not _is_compressible(headers.get("content-type", ""))
+                ):
+                    passthrough = True
+                    await send(message)
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                if not more_body:
+                    # 본문 전체가 한 번에 온 경우
+                    if len(body) < self.minimum_size:
+                        passthrough = True
+                        await send(start_message)
+                        await send(message)
+                        return
+                    compressed = compress_body(body, encoding)
+                    _mark_encoded(headers, encoding)
+                    headers["Content-Length"] = str(len(compressed))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                # 스트리밍 응답: 길이를 모르므로 Content-Length 제거 후 조각 단위 압축
+                compressor = _StreamCompressor(encoding)
+                _mark_encoded(headers, encoding)
+                del headers["Content-Length"]
+                await send(start_message)
+            data = compressor.chunk(body) if body else b""
+            if not more_body:
+                data += compressor.finish()
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def _mark_encoded(headers: MutableHeaders, encoding: str) -> None:
+    headers["Content-Encoding"] = encoding
+    headers.add_vary_header("Accept-Encoding")
+    # 압축본은 바이트가 달라지므로 강한 ETag를 약한 ETag로 (If-None-Match 비교는 W/ 무시)
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = "W/" + etag
@@ -1,8 +1,29 @@
 """SQLite DB 연결 및 초기화."""
+import os
+import re
+from datetime import datetime
+from typing import List
+
 import aiosqlite
 from pathlib import Path
 
+from app.models import Editorial
+
 DB_PATH = Path(__file__).resolve().parent.parent / "data" / "editorials.db"
+# 전문 검색(FTS5) 토크나이저. trigram(기본): 한국어 부분 일치(3글자 이상), unicode61: 띄어쓰기 단위 어절
+FTS_TOKENIZER = (os.environ.get("FTS_TOKENIZER") or "trigram").strip().lower()
+if FTS_TOKENIZER not in ("trigram", "unicode61"):
+    FTS_TOKENIZER = "trigram"
+# trigram 토크나이저는 3글자 미만 검색어를 색인으로 찾지 못함 → 2글자는 bigram 색인, 1글자는 LIKE로 처리
+FTS_MIN_TERM_LENGTH = 3 if FTS_TOKENIZER == "trigram" else 1
+# FTS5가 빠진 SQLite 빌드면 False → 검색은 LIKE로만
+fts_available = True
+# 2글자 검색어(검찰, 개헌 등)용 bigram 색인 사용 여부 (trigram일 때만)
+bigram_available = False
+# bigram을 만들 어절 (문자·숫자가 이어진 구간, 밑줄 제외)
+WORD_RE = re.compile(r"[^\W_]+")
+# bigram 색인을 다시 쓸 때 한 번에 읽는 사설 수
+BIGRAM_BATCH = 500
 
 
 async def get_db():
@@ -25,10 +46,376 @@ async def init_db(db):
             fetched_at TEXT NOT NULL
         )
     """)
+    # 어떤 스크래퍼가 수집했는지 (네이버 오피니언은 source가 개별 신문사명이라 별도 보관)
+    await _ensure_column(db, "editorials", "scraper", "TEXT")
+    # 본문 받기 실패 횟수와 다음 재시도 시각 (content가 NULL인 동안만 사용)
+    await _ensure_column(db, "editorials", "body_failures", "INTEGER NOT NULL DEFAULT 0")
+    await _ensure_column(db, "editorials", "body_retry_at", "TEXT")
     await db.execute(
         "CREATE INDEX IF NOT EXISTS idx_editorials_date ON editorials(published_date)"
     )
     await db.execute(
         "CREATE INDEX IF NOT EXISTS idx_editorials_source ON editorials(source)"
     )
+    # 스크래퍼·날짜별 마지막 수집 기록 (0건이어도 '수집했음'을 구분하기 위함)
+    await db.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_log (
+            scraper TEXT NOT NULL,
+            date TEXT NOT NULL,
+            item_count INTEGER NOT NULL,
+            fetched_at TEXT NOT NULL,
+            PRIMARY KEY (scraper, date)
+        )
+    """)
+    # 연속으로 0건이 나온 수집 횟수 (지난 날짜의 0건을 확정하기 전 재시도 판단용)
+    await _ensure_column(db, "scrape_log", "empty_runs", "INTEGER NOT NULL DEFAULT 0")
+    await _init_fts(db)
     await db.commit()
+
+
+async def _init_fts(db) -> None:
+    """editorials의 제목·요약·본문을 색인하는 FTS5 테이블(external content)과 동기화 트리거 생성.
+    토크나이저 설정이 바뀌었으면 색인을 새로 만듦."""
+    global fts_available
+    tokenize = "trigram" if FTS_TOKENIZER == "trigram" else "unicode61 remove_diacritics 2"
+    async with db.execute("SELECT sql FROM sqlite_master WHERE name = 'editorials_fts'") as cur:
+        row = await cur.fetchone()
+    rebuild = row is None
+    try:
+        if row is not None and f"tokenize='{tokenize}'" not in row[0]:
+            await db.execute("DROP TABLE editorials_fts")
+            rebuild = True
+        await db.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS editorials_fts USING fts5(
+                title, summary, content,
+                content='editorials', content_rowid='id', tokenize='{tokenize}'
+            )
+        """)
+    except aiosqlite.OperationalError as e:
+        fts_available = False
+        print(f"[검색] FTS5 사용 불가 → LIKE 검색만 사용: {e}")
+        return
+    await db.execute("""
+        CREATE TRIGGER IF NOT EXISTS editorials_fts_ai AFTER INSERT ON editorials BEGIN
+            INSERT INTO editorials_fts(rowid, title, summary, content)
+            VALUES (new.id, new.title, new.summary, new.content);
+        END
+    """)
+    await db.execute("""
+        CREATE TRIGGER IF NOT EXISTS editorials_fts_ad AFTER DELETE ON editorials BEGIN
+            INSERT INTO editorials_fts(editorials_fts, rowid, title, summary, content)
+            VALUES ('delete', old.id, old.title, old.summary, old.content);
+        END
+    """)
+    await db.execute("""
+        CREATE TRIGGER IF NOT EXISTS editorials_fts_au AFTER UPDATE OF title, summary, content ON editorials BEGIN
+            INSERT INTO editorials_fts(editorials_fts, rowid, title, summary, content)
+            VALUES ('delete', old.id, old.title, old.summary, old.content);
+            INSERT INTO editorials_fts(rowid, title, summary, content)
+            VALUES (new.id, new.title, new.summary, new.content);
+        END
+    """)
+    if rebuild:
+        # 기존에 저장된 사설까지 색인
+        await db.execute("INSERT INTO editorials_fts(editorials_fts) VALUES ('rebuild')")
+    await _init_bigram_fts(db)
+
+
+def _bigrams(text: str | None) -> str:
+    """어절마다 이웃한 두 글자를 공백으로 이어 붙임 ('검찰개혁 논의' → '검찰 찰개 개혁 논의').
+    어절 경계를 넘는 bigram은 만들지 않음 (LIKE '%검찰%'이 '검 찰'에 맞지 않는 것과 같게)."""
+    if not text:
+        return ""
+    return " ".join(
+        word[i:i + 2] for word in WORD_RE.findall(text) for i in range(len(word) - 1)
+    )
+
+
+def _is_bigram_term(term: str) -> bool:
+    return bigram_available and len(term) == 2 and term.isalnum()
+
+
+async def _init_bigram_fts(db) -> None:
+    """trigram 색인이 찾지 못하는 2글자 검색어용 FTS5 색인. 제목·요약·본문을 bigram 문자열로 바꿔 저장하고
+    unicode61로 색인 → 2글자 검색어가 bigram 토큰 하나와 맞아 bm25 순위를 받음.
+    bigram은 SQL로 만들 수 없어 트리거 대신 저장할 때 _index_bigrams로 갱신 (삭제만 트리거)."""
+    global bigram_available
+    bigram_available = False
+    if FTS_TOKENIZER != "trigram":
+        # unicode61은 어절 단위라 2글자 어절도 색인됨. 갱신되지 않는 색인이 남지 않도록 지움
+        await db.execute("DROP TRIGGER IF EXISTS editorials_fts_bigram_ad")
+        await db.execute("DROP TABLE IF EXISTS editorials_fts_bigram")
+        return
+    async with db.execute("SELECT 1 FROM sqlite_master WHERE name = 'editorials_fts_bigram'") as cur:
+        rebuild = await cur.fetchone() is None
+    await db.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS editorials_fts_bigram USING fts5(
+            title, summary, content, tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+    await db.execute("""
+        CREATE TRIGGER IF NOT EXISTS editorials_fts_bigram_ad AFTER DELETE ON editorials BEGIN
+            DELETE FROM editorials_fts_bigram WHERE rowid = old.id;
+        END
+    """)
+    bigram_available = True
+    if rebuild:
+        # 기존에 저장된 사설까지 색인
+        last_id = 0
+        while True:
+            async with db.execute(
+                "SELECT id FROM editorials WHERE id > ? ORDER BY id LIMIT ?", (last_id, BIGRAM_BATCH)
+            ) as cur:
+                ids = [row[0] for row in await cur.fetchall()]
+            if not ids:
+                break
+            await _index_bigrams(db, "id", ids)
+            last_id = ids[-1]
+
+
+async def _index_bigrams(db, key: str, values: list) -> None:
+    """editorials에서 key(id 또는 url)가 values인 사설의 bigram 색인을 다시 씀. 커밋은 호출하는 쪽에서."""
+    if not bigram_available:
+        return
+    for start in range(0, len(values), BIGRAM_BATCH):
+        chunk = values[start:start + BIGRAM_BATCH]
+        marks = ", ".join("?" * len(chunk))
+        async with db.execute(
+            f"SELECT id, title, summary, content FROM editorials WHERE {key} IN ({marks})", chunk
+        ) as cur:
+            rows = await cur.fetchall()
+        ids = [row[0] for row in rows]
+        await db.execute(
+            f"DELETE FROM editorials_fts_bigram WHERE rowid IN ({', '.join('?' * len(ids))})", ids
+        )
+        await db.executemany(
+            "INSERT INTO editorials_fts_bigram(rowid, title, summary, content) VALUES (?, ?, ?, ?)",
+            [(row[0], _bigrams(row[1]), _bigrams(row[2]), _bigrams(row[3])) for row in rows],
+        )
+
+
+async def _ensure_column(db, table: str, column: str, decl: str) -> None:
+    """기존 DB에 컬럼이 없으면 추가 (CREATE TABLE IF NOT EXISTS는 스키마를 바꾸지 않음)."""
+    async with db.execute(f"PRAGMA table_info({table})") as cur:
+        columns = [row[1] for row in await cur.fetchall()]
+    if column not in columns:
+        await db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+async def save_editorials(db, scraper: str, date: str, editorials: List[Editorial]) -> None:
+    """수집 결과를 url 기준 upsert하고 scrape_log에 수집 시각 기록. 이미 채워진 본문·요약은 유지."""
+    fetched_at = datetime.now().isoformat(timespec="seconds")
+    await db.executemany(
+        """
+        INSERT INTO editorials (source, title, url, summary, content, published_date, fetched_at, scraper)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(url) DO UPDATE SET
+            source = excluded.source,
+            title = excluded.title,
+            summary = COALESCE(excluded.summary, editorials.summary),
+            content = COALESCE(excluded.content, editorials.content),
+            published_date = excluded.published_date,
+            fetched_at = excluded.fetched_at,
+            scraper = excluded.scraper
+        """,
+        [
+            (e.source, e.title, e.url, e.summary, e.content, e.published_date, fetched_at, scraper)
+            for e in editorials
+        ],
+    )
+    await db.execute(
+        """
+        INSERT INTO scrape_log (scraper, date, item_count, fetched_at, empty_runs) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(scraper, date) DO UPDATE SET
+            item_count = excluded.item_count,
+            fetched_at = excluded.fetched_at,
+            empty_runs = CASE WHEN excluded.item_count = 0 THEN scrape_log.empty_runs + 1 ELSE 0 END
+        """,
+        (scraper, date, len(editorials), fetched_at, 0 if editorials else 1),
+    )
+    await _index_bigrams(db, "url", [e.url for e in editorials])
+    await db.commit()
+
+
+async def load_editorials(db, scraper: str, date: str) -> List[Editorial]:
+    """저장된 해당 날짜·스크래퍼의 사설 (idx_editorials_date 사용). 목록 응답에는 본문이 필요 없으므로
+    content는 읽지 않음(None). 본문을 아직 받지 않은 건수는 count_pending_bodies로."""
+    async with db.execute(
+        "SELECT source, title, url, summary, published_date FROM editorials "
+        "WHERE published_date = ? AND scraper = ?",
+        (date, scraper),
+    ) as cur:
+        rows = await cur.fetchall()
+    return [
+        Editorial(
+            source=row[0],
+            title=row[1],
+            url=row[2],
+            summary=row[3],
+            content=None,
+            published_date=row[4],
+        )
+        for row in rows
+    ]
+
+
+# 본문을 받는 대상 (네이버 뉴스 기사 페이지)
+BODY_URL_PATTERN = "%n.news.naver.com/%"
+
+
+async def count_pending_bodies(db, scraper: str, date: str) -> int:
+    """본문·요약을 아직 받지 않은(재시도 대기 포함) 네이버 기사 수."""
+    async with db.execute(
+        "SELECT COUNT(*) FROM editorials WHERE published_date = ? AND scraper = ? AND content IS NULL AND url LIKE ?",
+        (date, scraper, BODY_URL_PATTERN),
+    ) as cur:
+        return (await cur.fetchone())[0]
+
+
+async def urls_missing_content(db, scraper: str, date: str) -> List[str]:
+    """본문을 아직 받지 않은 사설 URL (content IS NULL). 받기 실패로 빈 문자열이 저장된 것과
+    재시도 시각(body_retry_at)이 아직 안 된 것은 제외."""
+    now = datetime.now().isoformat(timespec="seconds")
+    async with db.execute(
+        "SELECT url FROM editorials WHERE published_date = ? AND scraper = ? AND content IS NULL "
+        "AND (body_retry_at IS NULL OR body_retry_at <= ?)",
+        (date, scraper, now),
+    ) as cur:
+        return [row[0] for row in await cur.fetchall()]
+
+
+async def urls_due_for_body(db, limit: int) -> List[str]:
+    """날짜와 관계없이 본문을 받아야 할(재시도 시각이 된) 네이버 기사 URL, 최신 날짜부터."""
+    now = datetime.now().isoformat(timespec="seconds")
+    async with db.execute(
+        "SELECT url FROM editorials WHERE content IS NULL AND url LIKE ? "
+        "AND (body_retry_at IS NULL OR body_retry_at <= ?) ORDER BY published_date DESC LIMIT ?",
+        (BODY_URL_PATTERN, now, limit),
+    ) as cur:
+        return [row[0] for row in await cur.fetchall()]
+
+
+async def save_article_body(db, url: str, content: str, summary: str | None) -> None:
+    """본문·요약 저장. 이미 본문이 있으면 덮어쓰지 않고, 스크래퍼가 채운 요약은 유지."""
+    cur = await db.execute(
+        "UPDATE editorials SET content = ?, summary = COALESCE(summary, ?), body_retry_at = NULL "
+        "WHERE url = ? AND content IS NULL",
+        (content, summary, url),
+    )
+    if cur.rowcount:
+        await _index_bigrams(db, "url", [url])
+    await db.commit()
+
+
+async def record_body_failure(db, url: str, retry_at: str, max_failures: int) -> int:
+    """본문 받기 실패 기록 → 누적 실패 횟수. max_failures번째 실패면 빈 본문으로 확정해 더 받지 않음."""
+    await db.execute(
+        """
+        UPDATE editorials SET
+            body_failures = body_failures + 1,
+            body_retry_at = ?,
+            content = CASE WHEN body_failures + 1 >= ? THEN '' ELSE content END
+        WHERE url = ? AND content IS NULL
+        """,
+        (retry_at, max_failures, url),
+    )
+    await db.commit()
+    async with db.execute("SELECT body_failures FROM editorials WHERE url = ?", (url,)) as cur:
+        row = await cur.fetchone()
+    return row[0] if row else 0
+
+
+async def get_scrape_log(db, scraper: str, date: str) -> dict | None:
+    """해당 스크래퍼·날짜의 마지막 수집 기록. 없으면 None."""
+    async with db.execute(
+        "SELECT item_count, fetched_at, empty_runs FROM scrape_log WHERE scraper = ? AND date = ?",
+        (scraper, date),
+    ) as cur:
+        row = await cur.fetchone()
+    if row is None:
+        return None
+    return {"item_count": row[0], "fetched_at": row[1], "empty_runs": row[2]}
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term: str) -> str:
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+async def search_editorials(
+    db,
+    query: str,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    source: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> tuple[int, list[dict]]:
+    """저장된 사설 전문 검색 → (전체 건수, 결과). 검색어는 공백으로 나눠 모두 포함(AND).
+    색인으로 찾을 수 있는 검색어는 FTS5 MATCH + bm25 순위(제목 가중, trigram에서 2글자는 bigram 색인),
+    나머지 짧은 검색어는 LIKE로 거름. 색인 검색어가 없으면 최신 날짜순."""
+    terms = [t for t in query.split() if t]
+    fts_terms = [t for t in terms if fts_available and len(t) >= FTS_MIN_TERM_LENGTH]
+    bigram_terms = [t for t in terms if t not in fts_terms and _is_bigram_term(t)]
+    like_terms = [t for t in terms if t not in fts_terms and t not in bigram_terms]
+
+    where: list[str] = []
+    params: list = []
+    joins: list[str] = []
+    ranks: list[str] = []
+    if fts_terms:
+        joins.append("JOIN editorials_fts ON editorials_fts.rowid = e.id")
+        ranks.append("bm25(editorials_fts, 10.0, 3.0, 1.0)")
+        where.append("editorials_fts MATCH ?")
+        params.append(" AND ".join(_fts_phrase(t) for t in fts_terms))
+    if bigram_terms:
+        joins.append("JOIN editorials_fts_bigram ON editorials_fts_bigram.rowid = e.id")
+        ranks.append("bm25(editorials_fts_bigram, 10.0, 3.0, 1.0)")
+        where.append("editorials_fts_bigram MATCH ?")
+        params.append(" AND ".join(_fts_phrase(t) for t in bigram_terms))
+    for term in like_terms:
+        where.append(
+            "(e.title LIKE ? ESCAPE '\\' OR e.summary LIKE ? ESCAPE '\\' OR e.content LIKE ? ESCAPE '\\')"
+        )
+        params.extend([_like_pattern(term)] * 3)
+    if date_from:
+        where.append("e.published_date >= ?")
+        params.append(date_from)
+    if date_to:
+        where.append("e.published_date <= ?")
+        params.append(date_to)
+    if source:
+        where.append("e.source = ?")
+        params.append(source)
+    where_sql = " AND ".join(where) or "1"
+
+    from_sql = " ".join(["editorials e", *joins])
+    if ranks:
+        rank_sql = " + ".join(ranks)
+        order_sql = "score, e.published_date DESC"
+    else:
+        rank_sql = "0.0"
+        order_sql = "e.published_date DESC, e.id DESC"
+
+    async with db.execute(f"SELECT COUNT(*) FROM {from_sql} WHERE {where_sql}", params) as cur:
+        total = (await cur.fetchone())[0]
+    async with db.execute(
+        f"SELECT e.source, e.title, e.url, e.summary, e.published_date, {rank_sql} AS score "
+        f"FROM {from_sql} WHERE {where_sql} ORDER BY {order_sql} LIMIT ? OFFSET ?",
+        [*params, limit, offset],
+    ) as cur:
+        rows = await cur.fetchall()
+    return total, [
+        {
+            "source": row[0],
+            "title": row[1],
+            "url": row[2],
+            "summary": (row[3] or "")[:300],
+            "published_date": row[4],
+            "score": round(-row[5], 4) if ranks else None,
+        }
+        for row in rows
+    ]
@@ -0,0 +1,309 @@
+"""사설 수집·저장: 스크래퍼 실행 결과를 SQLite에 저장하고, 저장된 날짜는 DB에서 바로 응답 (read-through)."""
+import asyncio
+import os
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import List
+
+import aiosqlite
+
+from app.article_bodies import body_fetcher
+from app.database import (
+    DB_PATH,
+    count_pending_bodies,
+    get_scrape_log,
+    load_editorials,
+    save_editorials,
+    urls_missing_content,
+)
+from app.metrics import editorials_parsed, scraper_latency, scraper_runs
+from app.models import Editorial
+from app.scrapers.base import BaseScraper
+from app.timings import collect, phase
+
+# 수집 시 신문사당 최대 대기(초). 12월 등 과거 날짜까지 페이지를 많이 돌리므로 여유 있게.
+FETCH_SCRAPER_TIMEOUT = 90
+# 오늘 날짜는 사설이 계속 올라오므로 이 시간(초)이 지나면 다시 수집
+TODAY_REFRESH_SECONDS = int(os.environ.get("TODAY_REFRESH_SECONDS", "600"))
+# 지난 날짜가 0건으로 수집되면 이 횟수만큼 연속으로 0건일 때까지 다시 수집 (네이버가 빈 목록을 200으로 주는 경우 대비)
+EMPTY_PAST_RETRIES = int(os.environ.get("EMPTY_PAST_RETRIES", "3"))
+# 백그라운드 미리 수집 주기(초). 0이면 끔. 켜져 있으면 /api/editorials는 오늘 날짜도 저장분만 읽음
+PREFETCH_INTERVAL_SECONDS = int(os.environ.get("PREFETCH_INTERVAL_SECONDS", "600"))
+# 여러 인스턴스가 같은 시각에 몰리지 않도록 주기에 더하는 무작위 지연(초, ±)
+PREFETCH_JITTER_SECONDS = int(os.environ.get("PREFETCH_JITTER_SECONDS", "60"))
+# 저장분으로 응답할 때 ?timings=1에 함께 보여 줄 최근 수집 단계별 시간 (스크래퍼·날짜별, 최근 것만)
+LAST_TIMINGS_MAX = 256
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출은 먼저 시작된 작업 하나의 결과를 함께 기다림.
+    키는 (스크래퍼, 날짜). 요청이 끊겨도 공유 작업은 취소되지 않도록 shield로 감쌈.
+    """
+
+    def __init__(self):
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self.started = 0
+        self.coalesced = 0
+        self._by_scraper: dict[str, dict] = {}
+
+    async def do(self, key: tuple, fn):
+        counts = self._by_scraper.setdefault(key[0], {"started": 0, "coalesced": 0})
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            counts["coalesced"] += 1
+            return await asyncio.shield(task)
+        self.started += 1
+        counts["started"] += 1
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+
+        def _forget(done, key=key):
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+
+        task.add_done_callback(_forget)
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            "started": self.started,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+            "by_scraper": {name: dict(c) for name, c in self._by_scraper.items()},
+        }
+
+
+scrape_flight = SingleFlight()
+
+
+def today_str() -> str:
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _log_age_seconds(log: dict) -> float | None:
+    try:
+        return (datetime.now() - datetime.fromisoformat(log["fetched_at"])).total_seconds()
+    except ValueError:
+        return None
+
+
+def is_final_log(log: dict | None, date: str) -> bool:
+    """지난 날짜 기록이 확정돼 다시 수집할 필요가 없는지. 그날이 지난 뒤 수집했고, 사설이 있거나
+    EMPTY_PAST_RETRIES번 연속 0건(휴간일 등)이면 확정. 0건은 일시적인 차단·빈 응답일 수 있어 바로 확정하지 않음."""
+    if not log or date >= today_str() or log["fetched_at"][:10] <= date:
+        return False
+    return log["item_count"] > 0 or log.get("empty_runs", 0) >= EMPTY_PAST_RETRIES
+
+
+def is_fresh_log(log: dict, date: str) -> bool:
+    """저장된 수집 기록을 그대로 써도 되는지. 지난 날짜는 확정된 기록(is_final_log)이면 계속,
+    아직 확정되지 않은 0건은 오늘 날짜처럼 TODAY_REFRESH_SECONDS 뒤 다시 수집.
+    (수집 실패(예외·시간 초과)는 기록되지 않음)"""
+    if not log:
+        return False
+    today = today_str()
+    if date < today:
+        if is_final_log(log, date):
+            return True
+        if log["fetched_at"][:10] <= date:
+            return False
+        age = _log_age_seconds(log)
+        return age is not None and age < TODAY_REFRESH_SECONDS
+    if date == today:
+        if log["item_count"] <= 0:
+            return False
+        age = _log_age_seconds(log)
+        if age is None:
+            return False
+        max_age = TODAY_REFRESH_SECONDS
+        if prefetch_scheduler.running:
+            # 스케줄러가 갱신하므로 요청 경로에서는 다시 수집하지 않음 (스케줄러가 멈춘 경우만 예외)
+            max_age = max(max_age, PREFETCH_INTERVAL_SECONDS * 3)
+        return age < max_age
+    return False
+
+
+_last_timings: OrderedDict = OrderedDict()
+
+
+def last_timings(name: str, date: str) -> dict | None:
+    """이 프로세스에서 마지막으로 수집했을 때의 단계별 시간. 없으면 None."""
+    return _last_timings.get((name, date))
+
+
+async def scrape_and_store(ScraperCls: type[BaseScraper], date: str) -> tuple[str, List[Editorial], dict]:
+    """스크래퍼를 실행해 (신문사명, 사설 목록, 메타)를 반환. 성공하면 DB에 저장하고 본문 수집을 예약.
+    메타의 timings에는 단계별 시간(Playwright·HTTP·파싱·중복 제거·저장)과 사설을 찾은 경로."""
+    scraper = ScraperCls()
+    with collect() as timings:
+        name, editorials, meta = await _run_scraper(scraper, date)
+    meta["timings"] = timings.to_dict()
+    _last_timings[(name, date)] = meta["timings"]
+    _last_timings.move_to_end((name, date))
+    while len(_last_timings) > LAST_TIMINGS_MAX:
+        _last_timings.popitem(last=False)
+    return name, editorials, meta
+
+
+async def _run_scraper(scraper: BaseScraper, date: str) -> tuple[str, List[Editorial], dict]:
+    started = time.perf_counter()
+    try:
+        editorials = await asyncio.wait_for(
+            scraper.fetch_editorials_for_date(date), timeout=FETCH_SCRAPER_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        scraper_runs.inc(scraper=scraper.source_name, outcome="timeout")
+        return scraper.source_name, [], {"count": 0, "error": f"시간 초과({FETCH_SCRAPER_TIMEOUT}초)"}
+    except Exception as e:
+        scraper_runs.inc(scraper=scraper.source_name, outcome="error")
+        return scraper.source_name, [], {"count": 0, "error": str(e)[:200]}
+    finally:
+        scraper_latency.observe(time.perf_counter() - started, scraper=scraper.source_name)
+    scraper_runs.inc(scraper=scraper.source_name, outcome="ok")
+    for e in editorials:
+        editorials_parsed.inc(source=e.source)
+    meta = {"count": len(editorials)}
+    # 미래 날짜는 저장하지 않음 (아직 확정되지 않은 목록)
+    if date <= today_str():
+        try:
+            with phase("save"):
+                async with aiosqlite.connect(DB_PATH) as db:
+                    await save_editorials(db, scraper.source_name, date, editorials)
+                    # 본문이 아직 없는 기사만 본문 수집 큐로 (이미 받은 본문은 다시 받지 않음)
+                    body_fetcher.enqueue(await urls_missing_content(db, scraper.source_name, date))
+                    meta["bodies_pending"] = await count_pending_bodies(db, scraper.source_name, date)
+        except Exception as e:
+            print(f"[저장 오류] {scraper.source_name} {date}: {e!r}")
+    return scraper.source_name, editorials, meta
+
+
+async def get_editorials(ScraperCls: type[BaseScraper], date: str) -> tuple[str, List[Editorial], dict]:
+    """get_editorials_uncoalesced와 같되, 같은 스크래퍼·날짜의 동시 요청은 한 번만 수집."""
+    name, editorials, meta = await scrape_flight.do(
+        (ScraperCls.source_name, date), lambda: get_editorials_uncoalesced(ScraperCls, date)
+    )
+    return name, editorials, dict(meta)
+
+
+async def get_editorials_uncoalesced(ScraperCls: type[BaseScraper], date: str) -> tuple[str, List[Editorial], dict]:
+    """저장된 결과가 유효하면 DB에서, 아니면 수집 후 저장. 수집 실패 시 이전 저장분이 있으면 그것을 반환."""
+    name = ScraperCls.source_name
+    stored: List[Editorial] = []
+    started = time.perf_counter()
+    try:
+        async with aiosqlite.connect(DB_PATH) as db:
+            log = await get_scrape_log(db, name, date)
+            if log:
+                stored = await load_editorials(db, name, date)
+                if is_fresh_log(log, date):
+                    pending = await count_pending_bodies(db, name, date)
+                    timings = {
+                        "db_ms": round((time.perf_counter() - started) * 1000, 1),
+                        "paths": {"db": len(stored)},
+                        "last_scrape": last_timings(name, date),
+                    }
+                    meta = {"count": len(stored), "cached": True, "bodies_pending": pending, "timings": timings}
+                    return name, stored, meta
+    except Exception as e:
+        print(f"[저장소 오류] {name} {date}: {e!r}")
+
+    name, editorials, meta = await scrape_and_store(ScraperCls, date)
+    if meta.get("error") and stored:
+        return name, stored, {"count": len(stored), "cached": True, "error": meta["error"], "timings": meta["timings"]}
+    return name, editorials, meta
+
+
+class PrefetchScheduler:
+    """SCRAPERS 전체를 오늘 날짜로 주기적으로 수집해 저장 → 사용자는 수집 지연 없이 DB만 읽음."""
+
+    def __init__(self, interval: int = PREFETCH_INTERVAL_SECONDS, jitter: int = PREFETCH_JITTER_SECONDS):
+        self.interval = interval
+        self.jitter = jitter
+        self._task: asyncio.Task | None = None
+        self.runs = 0
+        self.last_run_started_at: str | None = None
+        self.last_run_duration: float | None = None
+        self.by_source: dict[str, dict] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, scrapers: list[type[BaseScraper]]) -> bool:
+        if self.interval <= 0 or self.running:
+            return False
+        self._task = asyncio.create_task(self._loop(list(scrapers)))
+        return True
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _next_delay(self) -> float:
+        return max(1.0, self.interval + random.uniform(-self.jitter, self.jitter))
+
+    async def _loop(self, scrapers: list[type[BaseScraper]]) -> None:
+        # 서버 시작 직후 바로 몰리지 않게 짧게 지연 후 첫 수집
+        await asyncio.sleep(random.uniform(1.0, max(1.0, float(self.jitter))))
+        while True:
+            try:
+                await self.run_once(scrapers)
+            except Exception as e:
+                print(f"[미리 수집] 오류: {e!r}")
+            await asyncio.sleep(self._next_delay())
+
+    async def run_once(self, scrapers: list[type[BaseScraper]]) -> None:
+        date = today_str()
+        self.runs += 1
+        self.last_run_started_at = datetime.now().isoformat(timespec="seconds")
+        started = time.monotonic()
+        await asyncio.gather(*[self._run_scraper(cls, date) for cls in scrapers])
+        self.last_run_duration = round(time.monotonic() - started, 2)
+
+    async def _run_scraper(self, ScraperCls: type[BaseScraper], date: str) -> None:
+        name = ScraperCls.source_name
+        status = self.by_source.setdefault(name, {
+            "last_success_at": None,
+            "last_duration": None,
+            "last_count": None,
+            "last_error": None,
+            "failures": 0,
+        })
+        started = time.monotonic()
+        # 사용자 요청과 같은 키로 합쳐서 같은 날짜를 두 번 수집하지 않음
+        _, editorials, meta = await scrape_flight.do(
+            (name, date), lambda: scrape_and_store(ScraperCls, date)
+        )
+        status["last_duration"] = round(time.monotonic() - started, 2)
+        if meta.get("error") and not meta.get("cached"):
+            status["last_error"] = meta["error"]
+            status["failures"] += 1
+            return
+        status["last_success_at"] = datetime.now().isoformat(timespec="seconds")
+        status["last_count"] = len(editorials)
+        status["last_error"] = None
+
+    def status(self) -> dict:
+        return {
+            "enabled": self.interval > 0,
+            "running": self.running,
+            "interval_seconds": self.interval,
+            "jitter_seconds": self.jitter,
+            "timeout_seconds": FETCH_SCRAPER_TIMEOUT,
+            "runs": self.runs,
+            "last_run_started_at": self.last_run_started_at,
+            "last_run_duration": self.last_run_duration,
+            "by_source": {name: dict(st) for name, st in self.by_source.items()},
+        }
+
+
+prefetch_scheduler = PrefetchScheduler()
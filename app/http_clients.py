@@ -0,0 +1,121 @@
+"""공유 httpx.AsyncClient 레지스트리.
+   호스트마다 클라이언트 하나를 keep-alive로 재사용 → 같은 호스트(news.naver.com, googleapis.com 등)로의
+   반복 요청이 TCP·TLS 연결을 새로 맺지 않음. 앱 종료(lifespan) 시 aclose()로 정리.
+"""
+import os
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.metrics import upstream_bytes, upstream_latency, upstream_requests
+from app.timings import record_fetch
+
+# 호스트당 최대 동시 연결 수 / 유지할 keep-alive 연결 수
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.environ.get("HTTP_MAX_CONNECTIONS_PER_HOST", "10"))
+HTTP_MAX_KEEPALIVE_PER_HOST = int(os.environ.get("HTTP_MAX_KEEPALIVE_PER_HOST", "5"))
+HTTP_KEEPALIVE_EXPIRY = 60.0
+HTTP_DEFAULT_TIMEOUT = 20.0
+# HTTP/2 사용 (h2 패키지 필요: pip install "httpx[http2]"). 설치돼 있지 않으면 HTTP/1.1
+HTTP2_ENABLED = (os.environ.get("HTTP2") or "").strip().lower() in ("1", "true", "yes")
+
+
+def _http2_available() -> bool:
+    if not HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def _on_request(request: httpx.Request) -> None:
+    request.extensions["started_at"] = time.perf_counter()
+
+
+async def _on_response(response: httpx.Response) -> None:
+    """호스트별 요청 수·응답 시간·받은 바이트 기록 (수집 중이면 단계별 시간에도). 호출하는 쪽도 본문 전체를 쓰므로 여기서 미리 읽음."""
+    await response.aread()
+    host = response.request.url.host
+    nbytes = response.num_bytes_downloaded or len(response.content)
+    started = response.request.extensions.get("started_at")
+    if started is not None:
+        elapsed = time.perf_counter() - started
+        upstream_latency.observe(elapsed, host=host)
+        record_fetch(str(response.request.url), elapsed, nbytes, response.status_code)
+    upstream_requests.inc(host=host, status=response.status_code)
+    upstream_bytes.inc(nbytes, host=host)
+
+
+class HttpClientRegistry:
+    """호스트별 공유 AsyncClient. 닫힌 뒤 다시 요청하면 새로 만듦."""
+
+    def __init__(self):
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._http2 = _http2_available()
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        host = urlsplit(url).hostname or url
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                follow_redirects=True,
+                timeout=HTTP_DEFAULT_TIMEOUT,
+                http2=self._http2,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS_PER_HOST,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_PER_HOST,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+                ),
+                event_hooks={"request": [_on_request], "response": [_on_response]},
+            )
+            self._clients[host] = client
+        return client
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+
+    def status(self) -> dict:
+        return {"http2": self._http2, "hosts": sorted(h for h, c in self._clients.items() if not c.is_closed)}
+
+
+http_clients = HttpClientRegistry()
+
+
+class HttpSession:
+    """공유 클라이언트를 기존 `async with httpx.AsyncClient(...)` 코드처럼 쓰기 위한 얇은 래퍼.
+    요청마다 기본 헤더·타임아웃을 붙이고, 블록을 나가도 연결을 닫지 않음 (keep-alive 유지).
+    """
+
+    def __init__(self, client: httpx.AsyncClient, headers: dict | None = None, timeout: float | None = None):
+        self.client = client
+        self.headers = headers or {}
+        self.timeout = timeout if timeout is not None else HTTP_DEFAULT_TIMEOUT
+
+    async def __aenter__(self) -> "HttpSession":
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        headers = {**self.headers, **(kwargs.pop("headers", None) or {})}
+        kwargs.setdefault("timeout", self.timeout)
+        return await self.client.request(method, url, headers=headers, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+
+def http_session(url: str, headers: dict | None = None, timeout: float | None = None) -> HttpSession:
+    """url의 호스트용 공유 클라이언트로 세션 생성."""
+    return HttpSession(http_clients.get(url), headers=headers, timeout=timeout)
@@ -1,14 +1,19 @@
 """FastAPI 앱: 사설 수집·조회 API 및 웹 페이지."""
 import asyncio
+import hashlib
+import json
+from collections import OrderedDict
 import os
-import re
+import secrets
+import time
 from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, Depends, Query
-from fastapi.responses import RedirectResponse, PlainTextResponse
+from fastapi.responses import RedirectResponse, PlainTextResponse, Response, StreamingResponse
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -21,11 +26,22 @@ from fastapi import Request
 
 import aiosqlite
 
-from app.database import get_db, init_db, DB_PATH
+from app.article_bodies import body_fetcher
+from app.backfill import Backfill, backfill_dates
+from app.database import get_db, get_scrape_log, init_db, search_editorials, DB_PATH
+from app.editorial_service import (
+    get_editorials,
+    is_fresh_log,
+    prefetch_scheduler,
+    scrape_flight,
+)
+from app.compression import CompressionMiddleware
+from app.http_clients import http_clients
+from app.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, registry as metrics_registry
+from app.page_cache import PageCache, RenderedPage
+from app.parse_executor import parse_executor
 from app.scrapers import SCRAPERS
-
-# 수집 시 신문사당 최대 대기(초). 12월 등 과거 날짜까지 페이지를 많이 돌리므로 여유 있게.
-FETCH_SCRAPER_TIMEOUT = 90
+from app.scrapers.browser import browser_pool
 
 
 @asynccontextmanager
@@ -39,7 +55,22 @@ async def lifespan(app: FastAPI):
         print("[유튜브] Google 로그인: 설정됨")
     else:
         print("[유튜브] Google 로그인: .env에 GOOGLE_CLIENT_ID가 없습니다. 유튜브 구독 영상 로그인이 동작하지 않습니다.")
-    yield
+    if await browser_pool.start():
+        print(f"[브라우저 풀] Chromium 실행 (동시 페이지 최대 {browser_pool.size}개)")
+    else:
+        print("[브라우저 풀] Chromium 사용 불가 → httpx 수집 경로만 사용")
+    body_fetcher.start()
+    if prefetch_scheduler.start(SCRAPERS):
+        print(f"[미리 수집] 오늘 사설을 {prefetch_scheduler.interval}초마다 수집")
+    try:
+        yield
+    finally:
+        await _stop_backfill()
+        await prefetch_scheduler.stop()
+        await body_fetcher.stop()
+        await browser_pool.stop()
+        await http_clients.aclose()
+        parse_executor.stop()
 
 
 app = FastAPI(title="신문 사설 모음", lifespan=lifespan)
@@ -57,49 +88,19 @@ async def global_exception_handler(request: Request, exc: Exception):
 # 세션 (유튜브 구독 영상용 Google 로그인)
 SECRET_KEY = os.environ.get("SECRET_KEY", "change-me-in-production-use-env")
 app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY, max_age=14 * 24 * 3600)
+# JSON·HTML 응답 압축 (br/gzip). 미리 압축해 둔 응답(Content-Encoding 있음)은 그대로 통과
+app.add_middleware(CompressionMiddleware)
+# 경로별 응답 시간 (/metrics). 가장 바깥에서 압축까지 포함해 측정
+app.add_middleware(MetricsMiddleware)
 
 
-async def _inject_google_site_verification_middleware(request: Request, call_next):
-    """메인(/) HTML 응답에 google-site-verification meta 삽입. 라우트 이후 실행되어 확실히 반영."""
-    response = await call_next(request)
-    if request.url.path != "/" or request.method != "GET":
-        return response
-    content_type = response.headers.get("content-type", "")
-    if "text/html" not in content_type:
-        return response
-    try:
-        body_bytes = b""
-        async for chunk in response.body_iterator:
-            body_bytes += chunk
-        body = body_bytes.decode("utf-8", errors="replace")
-    except Exception:
-        return response
-    content = _google_site_verification_content()
-    injected = False
-    if content and "google-site-verification" not in body:
-        meta = f'<meta name="google-site-verification" content="{content}" />'
-        before = body
-        body = re.sub(r"\s*</head>\s*", "\n  " + meta + "\n</head>", body, count=1)
-        if body != before:
-            injected = True
-        elif "<head" in body:
-            body = re.sub(r"(<head[^>]*>)", r"\1\n  " + meta + "\n  ", body, count=1)
-            injected = True
-    new_response = HTMLResponse(body)
-    for k, v in response.headers.items():
-        if k.lower() not in ("content-length", "content-encoding"):
-            new_response.headers[k] = v
-    new_response.headers["X-Google-Site-Verification-Injected"] = "true" if injected else "false"
-    return new_response
-
-
-app.middleware("http")(_inject_google_site_verification_middleware)
-
 # 정적 파일 및 템플릿 (프로젝트 루트 기준)
 static_dir = BASE_DIR / "static"
 if static_dir.is_dir():
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# 페이지 HTML은 설정값(환경 변수)에만 의존 → 설정이 같으면 렌더·압축 결과 재사용
+page_cache = PageCache(templates.env)
 
 
 @app.get("/health")
@@ -108,6 +109,12 @@ async def health():
     return {"status": "ok"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 수집용 지표 (스크래퍼·외부 호스트·파싱·Playwright·유튜브 API·경로별 응답 시간)."""
+    return PlainTextResponse(metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get("/api/deploy-info")
 async def deploy_info():
     """Railway가 실제로 배포한 커밋 확인용. push 반영 여부 점검 시 사용."""
@@ -128,6 +135,12 @@ async def site_verification_status():
     return {"set": bool(content)}
 
 
+@app.get("/api/browser-status")
+async def browser_status():
+    """공유 Chromium 풀 상태 (생존 여부, 사용 중 페이지 수, 재시작 횟수)."""
+    return browser_pool.status()
+
+
 @app.get("/api/debug-ga-gtm")
 async def debug_ga_gtm():
     """GA/GTM 환경 변수가 앱에서 보이는지 확인. HTML에 코드가 없을 때 원인 파악용."""
@@ -168,41 +181,17 @@ def _google_site_verification_content() -> str:
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
+    """메인 페이지. google-site-verification meta는 템플릿이 head에 직접 렌더 (응답 후처리 없음).
+    설정값이 같으면 캐시된 렌더 결과(gzip/br 포함)를 ETag와 함께 반환."""
     try:
         google_site_verification = _google_site_verification_content()
-        # Jinja2 환경에서 템플릿 렌더 (env 없으면 TemplateResponse로 대체)
-        try:
-            template = templates.env.get_template("index.html")
-            body = template.render(
-                {
-                    "request": request,
-                    "google_site_verification": google_site_verification,
-                    **_ga_gtm_context(),
-                }
-            )
-        except AttributeError:
-            resp = templates.TemplateResponse(
-                "index.html",
-                {"request": request, "google_site_verification": google_site_verification, **_ga_gtm_context()},
-            )
-            return resp
-
-        injected = False
-        if google_site_verification:
-            meta = f'<meta name="google-site-verification" content="{google_site_verification}" />'
-            # 줄바꿈 차이(CRLF/LF) 무시하고 </head> 앞에 삽입
-            before = body
-            body = re.sub(r"\s*</head>\s*", "\n  " + meta + "\n</head>", body, count=1)
-            if body != before:
-                injected = True
-            elif "<head" in body:
-                body = re.sub(r"(<head[^>]*>)", r"\1\n  " + meta + "\n  ", body, count=1)
-                injected = True
-
-        response = HTMLResponse(body)
-        if google_site_verification:
-            response.headers["X-Google-Site-Verification-Injected"] = "true" if injected else "false"
-        return response
+        headers = {"X-Google-Site-Verification-Injected": "true"} if google_site_verification else None
+        page = page_cache.get(
+            "index.html",
+            {"google_site_verification": google_site_verification, **_ga_gtm_context()},
+            headers=headers,
+        )
+        return page.response(request)
     except Exception as e:
         print(f"[오류] 메인 페이지: {e!r}")
         return PlainTextResponse("메인 페이지를 불러오지 못했습니다. 새로고침해 주세요.", status_code=500)
@@ -211,13 +200,13 @@ async def index(request: Request):
 @app.get("/privacy", response_class=HTMLResponse)
 async def privacy_page(request: Request):
     """개인정보처리방침 (Google OAuth 동의 화면·검증용 URL)."""
-    return templates.TemplateResponse("privacy.html", {"request": request, **_ga_gtm_context()})
+    return page_cache.get("privacy.html", _ga_gtm_context()).response(request)
 
 
 @app.get("/terms", response_class=HTMLResponse)
 async def terms_page(request: Request):
     """서비스 약관 (Google OAuth 동의 화면·검증용 URL)."""
-    return templates.TemplateResponse("terms.html", {"request": request, **_ga_gtm_context()})
+    return page_cache.get("terms.html", _ga_gtm_context()).response(request)
 
 
 def _scraper_source_names():
@@ -225,12 +214,123 @@ def _scraper_source_names():
     return [cls().source_name for cls in SCRAPERS]
 
 
+def _scrapers_for_source(source: str | None) -> list:
+    """source 필터에 해당하는 스크래퍼 클래스 목록 (없으면 전체)."""
+    if source:
+        return [cls for cls in SCRAPERS if cls().source_name == source]
+    return list(SCRAPERS)
+
+
+def _editorial_item(e) -> dict:
+    return {
+        "source": e.source,
+        "title": e.title,
+        "url": e.url,
+        "summary": (e.summary or "")[:300],
+        "published_date": e.published_date,
+    }
+
+
+# 캐시 정책: 지난 날짜는 바뀌지 않으므로 길게, 오늘은 짧게 (CDN은 s-maxage, 만료 후에도 잠시 이전 응답 사용)
+CACHE_PAST_DATE = "public, max-age=86400, s-maxage=604800, stale-while-revalidate=86400"
+CACHE_TODAY = "public, max-age=60, s-maxage=60, stale-while-revalidate=300"
+# 본문·요약을 아직 받는 중이거나 일부 신문사 수집이 실패한 응답
+CACHE_INCOMPLETE = "public, max-age=30, stale-while-revalidate=60"
+CACHE_STATIC = "public, max-age=3600, stale-while-revalidate=86400"
+# ?timings=1 진단 응답 (매번 다른 값이므로 저장하지 않음)
+CACHE_NO_STORE = "no-store"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # 프록시가 압축하면서 약한 ETag(W/)로 바꾼 경우도 같은 것으로 봄
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
+
+# 바뀌지 않는 응답(지난 날짜 사설 목록)의 미리 압축한 본문. ETag → RenderedPage, 최근 것만 보관
+PRECOMPRESSED_MAX_ENTRIES = 64
+_precompressed_json: OrderedDict[str, RenderedPage] = OrderedDict()
+
+
+def _precompressed(body: bytes, etag: str, cache_control: str, media_type: str = "application/json") -> RenderedPage:
+    page = _precompressed_json.get(etag)
+    if page is None:
+        page = RenderedPage(body, media_type=media_type, cache_control=cache_control)
+        _precompressed_json[etag] = page
+        while len(_precompressed_json) > PRECOMPRESSED_MAX_ENTRIES:
+            _precompressed_json.popitem(last=False)
+    else:
+        _precompressed_json.move_to_end(etag)
+    return page
+
+
+def _cached_body(
+    request: Request,
+    body: bytes,
+    media_type: str,
+    cache_control: str,
+    last_modified: datetime | None = None,
+    precompress: bool = False,
+) -> Response:
+    """본문에 내용 해시 기반 강한 ETag·Cache-Control을 붙이고, If-None-Match가 같으면 304 (본문 없음).
+    precompress=True면 gzip/br 본문을 한 번만 만들어 두고 재사용 (요청마다 압축하지 않음)."""
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    if precompress:
+        return _precompressed(body, etag, cache_control, media_type).response(request)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
+
+
+def _cached_json(
+    request: Request,
+    payload: dict,
+    cache_control: str,
+    last_modified: datetime | None = None,
+    precompress: bool = False,
+) -> Response:
+    """JSON 응답용 _cached_body."""
+    body = json.dumps(payload, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    return _cached_body(request, body, "application/json", cache_control, last_modified, precompress)
+
+
+def _public_meta(meta: dict, timings: bool) -> dict:
+    """by_source에 넣을 신문사별 메타. 단계별 시간(timings)은 요청했을 때만."""
+    if timings:
+        return meta
+    return {k: v for k, v in meta.items() if k != "timings"}
+
+
+def _editorials_cache_control(date: str, results: list) -> str:
+    if any(meta.get("error") for _, _, meta in results):
+        return CACHE_INCOMPLETE
+    # 네이버 기사 본문·요약을 아직 받지 않은 항목이 있으면 곧 바뀜 (실패한 본문은 재시도 후 빈 본문으로 확정)
+    if any(meta.get("bodies_pending") for _, _, meta in results):
+        return CACHE_INCOMPLETE
+    today = datetime.now().strftime("%Y-%m-%d")
+    if date < today:
+        return CACHE_PAST_DATE
+    if date == today:
+        return CACHE_TODAY
+    return "no-store"
+
+
 @app.get("/api/editorials")
 async def list_editorials(
+    request: Request,
     date: str | None = Query(None, description="YYYY-MM-DD (없으면 오늘)"),
     source: str | None = Query(None, description="신문사 이름 필터"),
+    timings: bool = Query(False, description="1이면 by_source에 신문사별 단계별 시간·수집 경로 포함"),
 ):
-    """선택한 날짜의 사설을 실시간으로 스크랩해 반환. 3개 신문 병렬 수집으로 안정화."""
+    """선택한 날짜의 사설을 반환. DB에 저장된 날짜는 바로 응답하고, 없으면 스크랩 후 저장 (신문사별 병렬).
+    ETag가 같으면 304, 지난 날짜는 길게·오늘은 짧게 캐시 허용."""
     try:
         if not date:
             date = datetime.now().strftime("%Y-%m-%d")
@@ -238,57 +338,229 @@ async def list_editorials(
         if source and source not in allowed:
             return {"total": 0, "date": date, "items": [], "by_source": {}}
 
-        if source:
-            to_run = [cls for cls in SCRAPERS if cls().source_name == source]
-        else:
-            to_run = list(SCRAPERS)
-
-        async def run_one(ScraperCls):
-            scraper = ScraperCls()
-            try:
-                editorials = await asyncio.wait_for(
-                    scraper.fetch_editorials_for_date(date), timeout=FETCH_SCRAPER_TIMEOUT
-                )
-                return scraper.source_name, editorials, {"count": len(editorials)}
-            except asyncio.TimeoutError:
-                return scraper.source_name, [], {"count": 0, "error": f"시간 초과({FETCH_SCRAPER_TIMEOUT}초)"}
-            except Exception as e:
-                return scraper.source_name, [], {"count": 0, "error": str(e)[:200]}
-
-        results = await asyncio.gather(*[run_one(cls) for cls in to_run], return_exceptions=False)
+        to_run = _scrapers_for_source(source)
+        results = await asyncio.gather(*[get_editorials(cls, date) for cls in to_run], return_exceptions=False)
         items = []
         by_source = {}
         for name, editorials, meta in results:
-            by_source[name] = meta
-            for e in editorials:
-                items.append({
-                    "source": e.source,
-                    "title": e.title,
-                    "url": e.url,
-                    "summary": (e.summary or "")[:300],
-                    "published_date": e.published_date,
-                })
+            by_source[name] = _public_meta(meta, timings)
+            items.extend(_editorial_item(e) for e in editorials)
         items.sort(key=lambda x: (x["source"], x["title"]))
-        return {"total": len(items), "date": date, "items": items, "by_source": by_source}
+        payload = {"total": len(items), "date": date, "items": items, "by_source": by_source}
+        if timings:
+            return _cached_json(request, payload, CACHE_NO_STORE)
+        cache_control = _editorials_cache_control(date, results)
+        return _cached_json(request, payload, cache_control, precompress=cache_control == CACHE_PAST_DATE)
     except Exception as e:
         fallback_date = datetime.now().strftime("%Y-%m-%d")
         return {"total": 0, "date": fallback_date, "items": [], "by_source": {"오류": {"count": 0, "error": str(e)[:200]}}}
 
 
+def _stream_source_line(name: str, editorials: list, meta: dict) -> str:
+    items = sorted((_editorial_item(e) for e in editorials), key=lambda x: (x["source"], x["title"]))
+    return json.dumps({"type": "source", "source": name, "meta": meta, "items": items}, ensure_ascii=False) + "\n"
+
+
+def _stream_done_line(date: str, total: int, by_source: dict) -> str:
+    return json.dumps({"type": "done", "date": date, "total": total, "by_source": by_source}, ensure_ascii=False) + "\n"
+
+
+async def _all_stored(to_run: list, date: str) -> bool:
+    """to_run 전체에 그대로 쓸 수 있는 저장분이 있는지 (있으면 수집 없이 DB만 읽음)."""
+    async with aiosqlite.connect(DB_PATH) as db:
+        for cls in to_run:
+            if not is_fresh_log(await get_scrape_log(db, cls.source_name, date), date):
+                return False
+    return True
+
+
+@app.get("/api/editorials/stream")
+async def stream_editorials(
+    request: Request,
+    date: str | None = Query(None, description="YYYY-MM-DD (없으면 오늘)"),
+    source: str | None = Query(None, description="신문사 이름 필터"),
+    timings: bool = Query(False, description="1이면 meta에 신문사별 단계별 시간·수집 경로 포함"),
+):
+    """/api/editorials의 스트리밍판 (NDJSON). 신문사별 수집이 끝나는 대로 한 줄씩 보내고 마지막에 done 줄.
+    줄 형식: {"type": "source", "source", "meta", "items"} … {"type": "done", "date", "total", "by_source"}
+    지난 날짜가 모두 저장돼 있으면 기다릴 수집이 없으므로 한 번에 만들어 /api/editorials와 같은 ETag·캐시 정책으로 응답.
+    """
+    if not date:
+        date = datetime.now().strftime("%Y-%m-%d")
+    if source and source not in _scraper_source_names():
+        to_run = []
+    else:
+        to_run = _scrapers_for_source(source)
+
+    if not timings and to_run and date < datetime.now().strftime("%Y-%m-%d") and await _all_stored(to_run, date):
+        results = await asyncio.gather(*[get_editorials(cls, date) for cls in to_run])
+        by_source = {name: _public_meta(meta, False) for name, _, meta in results}
+        body = "".join(_stream_source_line(name, editorials, by_source[name]) for name, editorials, _ in results)
+        body += _stream_done_line(date, sum(len(editorials) for _, editorials, _ in results), by_source)
+        cache_control = _editorials_cache_control(date, results)
+        return _cached_body(
+            request, body.encode("utf-8"), "application/x-ndjson", cache_control,
+            precompress=cache_control == CACHE_PAST_DATE,
+        )
+
+    async def lines():
+        tasks = [asyncio.ensure_future(get_editorials(cls, date)) for cls in to_run]
+        total = 0
+        by_source = {}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    name, editorials, meta = await next_done
+                except Exception as e:
+                    name, editorials, meta = "오류", [], {"count": 0, "error": str(e)[:200]}
+                meta = _public_meta(meta, timings)
+                by_source[name] = meta
+                total += len(editorials)
+                yield _stream_source_line(name, editorials, meta)
+            yield _stream_done_line(date, total, by_source)
+        finally:
+            # 클라이언트가 끊겨도 공유 수집 작업(single-flight)은 계속되어 결과가 저장됨
+            for t in tasks:
+                t.cancel()
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/search")
+async def search(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (공백으로 나누면 모두 포함)"),
+    date_from: str | None = Query(None, description="YYYY-MM-DD 이후"),
+    date_to: str | None = Query(None, description="YYYY-MM-DD 이전"),
+    source: str | None = Query(None, description="신문사 이름 필터 (예: 조선일보)"),
+    page: int = Query(1, ge=1, le=500),
+    size: int = Query(20, ge=1, le=50),
+):
+    """저장된 사설 제목·요약·본문 전문 검색 (FTS5, 관련도순). 수집·저장된 날짜만 대상."""
+    started = time.perf_counter()
+    async with aiosqlite.connect(DB_PATH) as db:
+        total, items = await search_editorials(
+            db, q.strip(), date_from=date_from, date_to=date_to, source=source,
+            limit=size, offset=(page - 1) * size,
+        )
+    return {
+        "q": q,
+        "total": total,
+        "page": page,
+        "size": size,
+        "items": items,
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
 @app.get("/api/dates")
 async def list_dates(
+    request: Request,
     days: int = Query(90, ge=7, le=365, description="오늘 기준 최근 N일"),
 ):
-    """선택 가능한 날짜 목록(오늘 기준 최근 N일). DB 미사용."""
-    today = datetime.now().date()
+    """선택 가능한 날짜 목록(오늘 기준 최근 N일). DB 미사용. 자정까지 캐시 허용."""
+    now = datetime.now()
+    today = now.date()
     dates = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
-    return {"dates": dates}
+    midnight = datetime.combine(today, datetime.min.time())
+    until_midnight = max(1, int((midnight + timedelta(days=1) - now).total_seconds()))
+    return _cached_json(
+        request,
+        {"dates": dates},
+        f"public, max-age={until_midnight}",
+        last_modified=midnight.astimezone(),
+    )
 
 
 @app.get("/api/sources")
-async def list_sources():
-    """수집 대상 신문사 목록 (현재: 조선일보, 중앙일보)."""
-    return {"sources": _scraper_source_names()}
+async def list_sources(request: Request):
+    """수집 대상 신문사 목록 (현재: 조선일보, 중앙일보). 배포 때만 바뀌므로 캐시 허용."""
+    return _cached_json(request, {"sources": _scraper_source_names()}, CACHE_STATIC)
+
+
+@app.get("/api/scrape-stats")
+async def scrape_stats():
+    """동시 요청 합치기(single-flight) 통계. coalesced = 진행 중인 수집을 기다려 결과를 공유한 요청 수."""
+    return scrape_flight.stats()
+
+
+@app.get("/api/body-status")
+async def body_status():
+    """사설 본문 수집 큐 상태 (대기 중, 받은 수, 실패 수)."""
+    return body_fetcher.status()
+
+
+@app.get("/api/parse-status")
+async def parse_status():
+    """HTML 파싱 작업자 풀 상태 (대기 중 작업 수, 파싱·대기 시간 ms)."""
+    return parse_executor.status()
+
+
+@app.get("/api/prefetch-status")
+async def prefetch_status():
+    """백그라운드 미리 수집 상태 (신문사별 마지막 성공 시각, 소요 시간, 건수, 오류)."""
+    return prefetch_scheduler.status()
+
+
+# POST /api/backfill 관리자 토큰. 비어 있으면 API로는 시작할 수 없음 (python -m app.backfill만 사용)
+BACKFILL_ADMIN_TOKEN = (os.environ.get("BACKFILL_ADMIN_TOKEN") or "").strip()
+
+_backfill_job = None
+_backfill_task: asyncio.Task | None = None
+
+
+def _is_admin(request: Request) -> bool:
+    """Authorization: Bearer <토큰> 또는 X-Admin-Token 헤더가 BACKFILL_ADMIN_TOKEN과 같은지."""
+    if not BACKFILL_ADMIN_TOKEN:
+        return False
+    token = (request.headers.get("x-admin-token") or "").strip()
+    auth = request.headers.get("authorization") or ""
+    if not token and auth[:7].lower() == "bearer ":
+        token = auth[7:].strip()
+    return bool(token) and secrets.compare_digest(token.encode("utf-8"), BACKFILL_ADMIN_TOKEN.encode("utf-8"))
+
+
+async def _stop_backfill() -> None:
+    """앱 종료 시 진행 중인 일괄 수집 취소 (체크포인트가 있어 다음에 이어서 진행)."""
+    global _backfill_task
+    task, _backfill_task = _backfill_task, None
+    if task is None or task.done():
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+@app.post("/api/backfill")
+async def start_backfill(
+    request: Request,
+    days: int = Query(90, ge=2, le=365, description="오늘 기준 최근 N일"),
+    concurrency: int = Query(2, ge=1, le=4, description="동시에 수집할 날짜 수"),
+):
+    """과거 날짜 일괄 수집을 백그라운드로 시작 (관리자 토큰 필요). 이미 진행 중이면 그 상태를 반환."""
+    global _backfill_job, _backfill_task
+    if not BACKFILL_ADMIN_TOKEN:
+        return PlainTextResponse("API로 일괄 수집을 시작할 수 없습니다. python -m app.backfill을 사용하세요.", status_code=403)
+    if not _is_admin(request):
+        return PlainTextResponse("관리자 토큰이 필요합니다.", status_code=401, headers={"WWW-Authenticate": "Bearer"})
+    if _backfill_task is not None and not _backfill_task.done():
+        return {"started": False, **_backfill_job.status()}
+    _backfill_job = Backfill(backfill_dates(days), concurrency=concurrency)
+    _backfill_task = asyncio.create_task(_backfill_job.run())
+    return {"started": True, **_backfill_job.status()}
+
+
+@app.get("/api/backfill")
+async def backfill_status():
+    """과거 날짜 일괄 수집 진행 상황."""
+    if _backfill_job is None:
+        return {"running": False}
+    return {"running": _backfill_task is not None and not _backfill_task.done(), **_backfill_job.status()}
 
 
 @app.get("/api/scrapers")
@@ -298,7 +570,8 @@ async def list_scrapers():
 
 
 # ----- 유튜브 구독 영상 (기존 사설 기능과 무관) -----
-from app.youtube_service import get_google_oauth_url, exchange_code_for_tokens, fetch_subscription_feed
+from app.youtube_cache import cache_status as youtube_cache_status, channels_cache
+from app.youtube_service import get_google_oauth_url, exchange_code_for_tokens, fetch_subscription_feed, get_my_channel_id
 
 
 def _google_configured() -> bool:
@@ -372,6 +645,8 @@ async def auth_google_callback(request: Request, code: str | None = None):
             return RedirectResponse(url=f"{youtube_url}?error=login_failed", status_code=302)
         request.session["google_access_token"] = tokens.get("access_token")
         request.session["google_refresh_token"] = tokens.get("refresh_token")
+        # 피드 캐시 키 (토큰은 바뀌므로 사용자 채널 ID 사용)
+        request.session["youtube_user_id"] = await get_my_channel_id(tokens.get("access_token"))
         return RedirectResponse(url=youtube_url, status_code=302)
     except Exception:
         return RedirectResponse(url=f"{youtube_url}?error=login_failed", status_code=302)
@@ -397,6 +672,12 @@ async def api_youtube_debug(request: Request):
     }
 
 
+@app.get("/api/youtube/cache-status")
+async def api_youtube_cache_status():
+    """유튜브 피드 캐시 상태 (계층별 항목 수, 적중·stale 적중·미적중 수)."""
+    return youtube_cache_status()
+
+
 @app.get("/youtube", response_class=HTMLResponse)
 async def youtube_page(request: Request):
     """유튜브 구독 영상 페이지 (새 창)."""
@@ -411,9 +692,17 @@ async def api_youtube_feed(request: Request):
     if not access and not refresh:
         return {"logged_in": False, "channels": [], "videos": []}
     try:
-        channels, videos, new_token = await fetch_subscription_feed(access, refresh)
+        user_id = request.session.get("youtube_user_id")
+        if not user_id and access:
+            # 캐시 도입 전 로그인한 세션
+            user_id = await get_my_channel_id(access)
+        channels, videos, new_token = await fetch_subscription_feed(access, refresh, user_id=user_id)
         if new_token:
             request.session["google_access_token"] = new_token
+            if not user_id:
+                user_id = await get_my_channel_id(new_token)
+        if user_id:
+            request.session["youtube_user_id"] = user_id
         return {"logged_in": True, "channels": channels, "videos": videos}
     except Exception as e:
         return {"logged_in": True, "channels": [], "videos": [], "error": str(e)[:200]}
@@ -422,6 +711,9 @@ async def api_youtube_feed(request: Request):
 @app.get("/api/youtube/logout")
 async def api_youtube_logout(request: Request):
     """Google 로그아웃 후 /youtube로 리다이렉트."""
+    user_id = request.session.get("youtube_user_id")
+    if user_id:
+        channels_cache.invalidate(user_id)
     request.session.clear()
     return RedirectResponse(url=request.url_for("youtube_page"), status_code=302)
 
@@ -0,0 +1,244 @@
+"""Prometheus 텍스트 형식(/metrics) 지표.
+   prometheus_client 없이 쓰는 최소 구현: 레이블별 Counter·Gauge·Histogram과 이를 모아 출력하는 레지스트리.
+   느려진 원인이 네이버(호스트별 HTTP), Chromium(Playwright 페이지), 파싱, API 중 어디인지 구분하기 위함.
+"""
+import time
+
+# Starlette가 text/* 응답에 charset=utf-8을 붙임
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# 버킷(초): 외부 HTTP 요청, 스크래퍼 한 번 실행(최대 FETCH_SCRAPER_TIMEOUT), HTML 파싱, API 응답
+HTTP_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0)
+SCRAPE_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 90.0, 120.0)
+PARSE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+ROUTE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, object] = {}
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {self.labelnames} 필요, 받은 값 {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _samples(self) -> list[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in self._values.items()]
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """set·inc·dec 외에 set_function으로 출력 시점에 값을 읽어 올 수 있음 (레이블 없는 경우)."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        super().__init__(name, documentation, labelnames)
+        self._function = None
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, fn) -> None:
+        self._function = fn
+
+    def _samples(self) -> list[str]:
+        if self._function is not None:
+            try:
+                return [f"{self.name} {_format_value(float(self._function()))}"]
+            except Exception:
+                return []
+        return super()._samples()
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = HTTP_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        state = self._values.get(key)
+        if state is None:
+            # [버킷별 누적 개수..., 합계]
+            state = self._values[key] = [0] * len(self.buckets) + [0.0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[i] += 1
+        state[-1] += value
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for key, state in self._values.items():
+            for bound, count in zip(self.buckets, state):
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {count}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{labels} {state[-2]}")
+        return lines
+
+
+class MetricsRegistry:
+    """등록 순서대로 출력. 같은 이름을 두 번 등록하면 오류."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 지표: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = HTTP_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        return "\n".join(m.render() for m in self._metrics.values()) + "\n"
+
+
+registry = MetricsRegistry()
+
+# 외부 사이트 요청 (공유 httpx 클라이언트의 이벤트 훅에서 기록)
+upstream_requests = registry.counter(
+    "upstream_requests_total", "외부 호스트로 보낸 HTTP 요청 수", ("host", "status")
+)
+upstream_latency = registry.histogram(
+    "upstream_request_duration_seconds", "외부 호스트 응답 본문까지 받는 데 걸린 시간", ("host",), HTTP_BUCKETS
+)
+upstream_bytes = registry.counter(
+    "upstream_response_bytes_total", "외부 호스트에서 받은 바이트 수 (압축 상태 그대로)", ("host",)
+)
+
+# 스크래퍼
+scraper_runs = registry.counter(
+    "scraper_runs_total", "스크래퍼 실행 수. outcome=ok|timeout|error (timeout은 FETCH_SCRAPER_TIMEOUT 초과)",
+    ("scraper", "outcome"),
+)
+scraper_latency = registry.histogram(
+    "scraper_duration_seconds", "스크래퍼 한 번 실행(날짜 하나 수집)에 걸린 시간", ("scraper",), SCRAPE_BUCKETS
+)
+scraper_pages = registry.counter("scraper_pages_total", "스크래퍼가 받은 목록 페이지 수", ("scraper",))
+editorials_parsed = registry.counter("editorials_parsed_total", "수집한 사설 수 (신문사별)", ("source",))
+parse_latency = registry.histogram(
+    "parse_duration_seconds", "HTML 파싱 함수 실행 시간 (작업자 대기 제외)", ("function",), PARSE_BUCKETS
+)
+parse_queue_depth = registry.gauge("parse_queue_depth", "파싱 작업자를 기다리는 작업 수")
+
+# Playwright
+playwright_active_pages = registry.gauge("playwright_active_pages", "사용 중인 Playwright 페이지 수")
+playwright_up = registry.gauge("playwright_browser_up", "공유 Chromium이 살아 있으면 1")
+
+# 유튜브 Data API
+youtube_api_calls = registry.counter(
+    "youtube_api_calls_total", "유튜브 Data API 호출 수", ("endpoint", "status")
+)
+youtube_quota_units = registry.counter(
+    "youtube_quota_units_total", "유튜브 Data API 할당량 사용량(단위) 추정치", ("endpoint",)
+)
+
+# 이 서버의 API
+route_latency = registry.histogram(
+    "http_request_duration_seconds", "경로별 응답 시간", ("method", "route", "status"), ROUTE_BUCKETS
+)
+requests_in_progress = registry.gauge("http_requests_in_progress", "처리 중인 요청 수")
+
+
+class MetricsMiddleware:
+    """경로별 응답 시간 기록. 레이블은 실제 URL이 아닌 라우트 경로(/api/editorials 등)라 값 종류가 늘지 않음."""
+
+    def __init__(self, app):
+        self.app = app
+        self._route_paths: dict = {}
+
+    def _route_label(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "<unmatched>"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            path = "<unmatched>"
+            for route in getattr(scope.get("app"), "routes", []):
+                if getattr(route, "endpoint", None) is endpoint or getattr(route, "app", None) is endpoint:
+                    path = route.path
+                    break
+            self._route_paths[endpoint] = path
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        requests_in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            requests_in_progress.dec()
+            route_latency.observe(
+                time.perf_counter() - started,
+                method=scope.get("method", ""),
+                route=self._route_label(scope),
+                status=status,
+            )
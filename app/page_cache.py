@@ -0,0 +1,74 @@
+"""렌더한 HTML 페이지 메모리 캐시.
+   메인·개인정보처리방침·약관 페이지는 환경 변수(GA·GTM·사이트 인증 값)에만 의존하므로
+   설정값이 같으면 한 번 렌더한 결과와 미리 압축한 gzip/br 본문을 그대로 돌려줌.
+"""
+import hashlib
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.compression import brotli, compress_body, pick_encoding
+
+# 설정이 바뀌면 새로 렌더되므로 브라우저는 매번 ETag로 재검증 (변경 없으면 304)
+PAGE_CACHE_CONTROL = "no-cache"
+
+
+class RenderedPage:
+    """한 번 만든 응답 본문과 미리 압축한 gzip/br 본문. ETag는 인코딩마다 다르게 (같은 ETag로 다른 바이트를 주지 않도록).
+    HTML 페이지 외에 바뀌지 않는 JSON(지난 날짜 사설 목록)에도 사용."""
+
+    def __init__(
+        self,
+        body: str | bytes,
+        headers: dict | None = None,
+        media_type: str = "text/html; charset=utf-8",
+        cache_control: str = PAGE_CACHE_CONTROL,
+    ):
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.headers = headers or {}
+        self.media_type = media_type
+        self.cache_control = cache_control
+        digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self.etags = {"identity": f'"{digest}"', "gzip": f'"{digest}-gz"', "br": f'"{digest}-br"'}
+        self.variants = {"identity": self.body, "gzip": compress_body(self.body, "gzip", best=True)}
+        if brotli is not None:
+            self.variants["br"] = compress_body(self.body, "br", best=True)
+
+    def response(self, request: Request) -> Response:
+        encoding = pick_encoding(
+            request.headers.get("accept-encoding", ""), tuple(e for e in ("br", "gzip") if e in self.variants)
+        )
+        etag = self.etags[encoding]
+        headers = {
+            **self.headers,
+            "ETag": etag,
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(self.variants[encoding], media_type=self.media_type, headers=headers)
+
+
+class PageCache:
+    """템플릿 이름별로 마지막 렌더 결과 하나만 보관. 키는 (템플릿 객체, 설정값).
+    Jinja2가 템플릿 파일 변경을 감지해 새 객체를 주면 키가 달라져 다시 렌더."""
+
+    def __init__(self, env):
+        self.env = env
+        self._pages: dict[str, tuple[tuple, RenderedPage]] = {}
+        self.renders = 0
+
+    def get(self, name: str, context: dict, headers: dict | None = None) -> RenderedPage:
+        template = self.env.get_template(name)
+        key = (template, tuple(sorted(context.items())), tuple(sorted((headers or {}).items())))
+        cached = self._pages.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        page = RenderedPage(template.render(context), headers=headers)
+        self._pages[name] = (key, page)
+        self.renders += 1
+        return page
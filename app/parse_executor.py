@@ -0,0 +1,123 @@
+"""HTML 파싱 전용 실행기 (스레드 또는 프로세스 풀).
+   BeautifulSoup·lxml 파싱은 동기 CPU 작업이라 이벤트 루프에서 돌리면 그동안 다른 요청(/health 포함)이 멈춤.
+   스크래퍼는 파싱 함수를 parse_executor.run(...)으로 넘겨 풀에서 실행하고, 대기 중 작업 수·파싱 시간을 기록.
+"""
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from app.metrics import parse_latency, parse_queue_depth
+from app.timings import add_phase
+
+# 파싱 작업자 수. 0이면 풀 없이 이벤트 루프에서 바로 파싱 (기존 동작)
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+# thread(기본): lxml 파싱 중에는 GIL을 놓아 이벤트 루프가 계속 돎. process: 여러 코어에서 동시에 파싱
+PARSE_EXECUTOR = (os.environ.get("PARSE_EXECUTOR") or "thread").strip().lower()
+if PARSE_EXECUTOR not in ("thread", "process"):
+    PARSE_EXECUTOR = "thread"
+# 지연 시간 통계에 쓰는 최근 작업 수
+PARSE_LATENCY_WINDOW = 500
+
+
+def _timed_call(fn, args):
+    """작업자 안에서 실행: (결과, 실제 파싱 시간). 제출~완료 시간과의 차이가 대기 시간."""
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def _percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ParseExecutor:
+    """파싱 함수를 풀에서 실행. 프로세스 풀에서는 fn·인자·결과가 pickle 가능해야 함(모듈 수준 함수)."""
+
+    def __init__(self, workers: int = PARSE_WORKERS, kind: str = PARSE_EXECUTOR):
+        self.workers = max(0, workers)
+        self.kind = kind
+        self._executor: Executor | None = None
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._parse_seconds: deque = deque(maxlen=PARSE_LATENCY_WINDOW)
+        self._wait_seconds: deque = deque(maxlen=PARSE_LATENCY_WINDOW)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="parse")
+        return self._executor
+
+    async def run(self, fn, *args):
+        """fn(*args)를 풀에서 실행해 결과 반환. 풀이 꺼져 있으면 바로 실행."""
+        self.submitted += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        submitted_at = time.perf_counter()
+        try:
+            if self.workers == 0:
+                result, parse_time = _timed_call(fn, args)
+            else:
+                loop = asyncio.get_running_loop()
+                result, parse_time = await loop.run_in_executor(self._get_executor(), _timed_call, fn, args)
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        self.completed += 1
+        parse_latency.observe(parse_time, function=getattr(fn, "__qualname__", repr(fn)))
+        wait_time = max(0.0, time.perf_counter() - submitted_at - parse_time)
+        self._parse_seconds.append(parse_time)
+        self._wait_seconds.append(wait_time)
+        add_phase("parse", parse_time)
+        add_phase("parse_wait", wait_time)
+        return result
+
+    def stop(self) -> None:
+        """앱 종료 시 풀 정리. 다시 run하면 새로 만듦."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def queue_depth(self) -> int:
+        """작업자를 기다리는 작업 수 (실행 중인 것 제외)."""
+        return max(0, self.in_flight - self.workers) if self.workers else 0
+
+    def status(self) -> dict:
+        parse_ms = [s * 1000 for s in self._parse_seconds]
+        wait_ms = [s * 1000 for s in self._wait_seconds]
+
+        def rounded(value: float | None) -> float | None:
+            return None if value is None else round(value, 2)
+
+        return {
+            "executor": self.kind if self.workers else "inline",
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_in_flight": self.max_in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "parse_ms_avg": rounded(sum(parse_ms) / len(parse_ms)) if parse_ms else None,
+            "parse_ms_p95": rounded(_percentile(parse_ms, 0.95)),
+            "parse_ms_max": rounded(max(parse_ms)) if parse_ms else None,
+            "wait_ms_avg": rounded(sum(wait_ms) / len(wait_ms)) if wait_ms else None,
+            "wait_ms_p95": rounded(_percentile(wait_ms, 0.95)),
+        }
+
+
+parse_executor = ParseExecutor()
+parse_queue_depth.set_function(lambda: parse_executor.queue_depth)
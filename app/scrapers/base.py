@@ -1,11 +1,21 @@
 """사설 스크래퍼 베이스 클래스."""
+import asyncio
+import os
 import re
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
+from datetime import date as _date
 from email.utils import parsedate_to_datetime
-from typing import List
+from typing import Dict, Iterator, List, Tuple
 
+import httpx
+from bs4 import BeautifulSoup
+
+from app.http_clients import HttpSession, http_clients
+from app.metrics import scraper_pages
 from app.models import Editorial
+from app.parse_executor import parse_executor
+from app.timings import phase, record_path
 
 # 브라우저처럼 보이게 해서 목록 HTML을 받기 위한 공통 헤더
 BROWSER_HEADERS = {
@@ -21,6 +31,73 @@ RSS_HEADERS = {
 }
 
 
+# HTML 파서 백엔드: auto(설치된 것 중 가장 빠른 것), selectolax, lxml, html.parser(순수 파이썬, 항상 사용 가능)
+HTML_PARSER = (os.environ.get("HTML_PARSER") or "auto").strip().lower()
+
+
+def _module_available(name: str) -> bool:
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+def _pick_soup_features() -> str:
+    """BeautifulSoup 트리 빌더. lxml(C 파서)이 있으면 사용, 없으면 html.parser."""
+    if HTML_PARSER in ("auto", "lxml", "selectolax") and _module_available("lxml"):
+        return "lxml"
+    return "html.parser"
+
+
+def _pick_link_backend() -> str:
+    """링크만 훑는 빠른 경로용 엔진. selectolax(lexbor) → lxml → BeautifulSoup 순."""
+    if HTML_PARSER in ("auto", "selectolax") and _module_available("selectolax.lexbor"):
+        return "selectolax"
+    if HTML_PARSER in ("auto", "lxml", "selectolax") and _module_available("lxml.html"):
+        return "lxml"
+    return "bs4"
+
+
+SOUP_FEATURES = _pick_soup_features()
+LINK_BACKEND = _pick_link_backend()
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """부모·선택자 탐색이 필요한 파서용 BeautifulSoup 트리 (가능하면 lxml 빌더)."""
+    return BeautifulSoup(html, SOUP_FEATURES)
+
+
+def iter_links(html: str) -> Iterator[Tuple[str, str]]:
+    """문서의 모든 <a href>를 (href, 텍스트)로. 텍스트는 BeautifulSoup get_text(strip=True)와 같은 규칙
+    (텍스트 조각마다 strip 후 구분자 없이 이어 붙임). 트리 전체를 파이썬 객체로 만들지 않아 빠름."""
+    if LINK_BACKEND == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+
+        for node in LexborHTMLParser(html).css("a[href]"):
+            yield node.attributes.get("href") or "", node.text(deep=True, separator="", strip=True)
+        return
+    if LINK_BACKEND == "lxml":
+        import lxml.html
+
+        if not html.strip():
+            return
+        try:
+            root = lxml.html.document_fromstring(html)
+        except ValueError:
+            # <?xml encoding=...?> 선언이 있는 str은 lxml이 거부 → bytes로 다시 파싱
+            root = lxml.html.document_fromstring(
+                html.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8")
+            )
+        for a in root.iter("a"):
+            href = a.get("href")
+            if href is not None:
+                yield href, "".join(t.strip() for t in a.itertext())
+        return
+    for a in BeautifulSoup(html, "html.parser").find_all("a", href=True):
+        yield a.get("href") or "", a.get_text(strip=True)
+
+
 class BaseScraper(ABC):
     source_name: str = ""
     list_url: str = ""
@@ -28,6 +105,27 @@ class BaseScraper(ABC):
     page_param: str | None = "page"
     max_pages: int = 3  # 수집할 최대 페이지 수 (날짜 범위 넓히기)
     max_items: int = 80  # 최대 기사 수
+    # 목록이 최신순이면 True → 날짜 조회 시 공통 페이지네이터(조기 중단·시작 페이지 추정) 사용. parse_page 구현 필요
+    newest_first: bool = False
+    # 목록 페이지 요청 헤더·타임아웃 (fetch_page_html 기본 구현용)
+    request_headers: dict = BROWSER_HEADERS
+    request_timeout: float = 20.0
+    # 목록 페이지 요청이 실패(예외·빈 응답)하면 다시 시도할 횟수와 그 사이 대기(초)
+    page_retries: int = 1
+    page_retry_delay: float = 0.5
+
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        # 주입하지 않으면 호스트별 공유 클라이언트(keep-alive 재사용) 사용
+        self._client = client
+
+    def __getstate__(self):
+        # 프로세스 파싱 풀로 parse_page를 넘길 때 클라이언트(pickle 불가)는 빼고 보냄
+        return {**self.__dict__, "_client": None}
+
+    def http_session(self, url: str | None = None, headers: dict | None = None, timeout: float | None = None) -> HttpSession:
+        """url(기본: list_url) 호스트용 HTTP 세션. `async with` 블록을 나가도 연결은 닫지 않음."""
+        client = self._client or http_clients.get(url or self.list_url)
+        return HttpSession(client, headers=headers, timeout=timeout)
 
     def page_url(self, page: int) -> str:
         """페이지 번호(1-based)에 해당하는 목록 URL."""
@@ -42,10 +140,162 @@ class BaseScraper(ABC):
         pass
 
     async def fetch_editorials_for_date(self, date: str) -> List[Editorial]:
-        """해당 날짜(YYYY-MM-DD)의 사설만 수집. 기본은 전체 수집 후 날짜 필터."""
+        """해당 날짜(YYYY-MM-DD)의 사설만 수집. 최신순 목록이면 공통 페이지네이터, 아니면 전체 수집 후 날짜 필터."""
+        if self.newest_first:
+            return await self.paginate_for_date(date)
         all_ = await self.fetch_editorials()
         return [e for e in all_ if e.published_date == date]
 
+    def parse_page(self, html: str) -> List[Editorial]:
+        """목록 페이지 HTML → 사설 목록. 공통 페이지네이터를 쓰는 스크래퍼가 구현."""
+        raise NotImplementedError
+
+    async def fetch_page_html(self, client: HttpSession, page: int) -> str | None:
+        """목록 page쪽 HTML. 인코딩·브라우저 대체 경로가 필요한 스크래퍼는 재정의."""
+        r = await client.get(self.page_url(page))
+        r.raise_for_status()
+        return r.text
+
+    async def _fetch_page_items(self, client: HttpSession, page: int) -> List[Editorial] | None:
+        """page쪽 사설 목록 (사설이 없는 쪽이면 빈 목록). page_retries번 다시 시도해도 요청이 실패하거나
+        응답이 비면 None."""
+        for attempt in range(self.page_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.page_retry_delay)
+            try:
+                html = await self.fetch_page_html(client, page)
+            except Exception:
+                continue
+            if html:
+                scraper_pages.inc(scraper=self.source_name)
+                return await parse_executor.run(self.parse_page, html)
+        return None
+
+    async def fetch_list_pages(self) -> List[Editorial]:
+        """1쪽부터 max_pages쪽까지 차례로 수집 (중간에 실패하면 그때까지 모은 것). url 기준 중복 제거."""
+        results: List[Editorial] = []
+        async with self.http_session(headers=self.request_headers, timeout=self.request_timeout) as client:
+            for page in range(1, self.max_pages + 1):
+                items = await self._fetch_page_items(client, page)
+                if items is None:
+                    break
+                results.extend(items)
+        with phase("dedup"):
+            seen = set()
+            unique = [e for e in results if e.url not in seen and not seen.add(e.url)][: self.max_items]
+        record_path("list_html", len(unique))
+        return unique
+
+    async def paginate_for_date(self, target_date: str) -> List[Editorial]:
+        """최신순 목록에서 target_date 사설만 수집.
+        읽은 쪽의 날짜 폭으로 한 쪽당 일수를 추정해 과거 날짜는 해당 쪽 근처로 바로 이동하고,
+        지나친 쪽(전부 더 과거)을 만나면 그때부터는 못 미친 쪽과의 가운데를 읽어(이분 탐색) 찾은 뒤 그 앞뒤 쪽만 더 읽음.
+        요청이 실패한 쪽은 범위를 좁히는 근거로 쓰지 않고 건너뜀."""
+        try:
+            target = _date.fromisoformat(target_date)
+        except ValueError:
+            return []
+        pages: Dict[int, List[Editorial]] = {}
+        failed: set = set()
+
+        async with self.http_session(headers=self.request_headers, timeout=self.request_timeout) as client:
+
+            async def load(page: int) -> List[Editorial] | None:
+                """page쪽 사설 목록. 요청이 실패한 쪽은 None (다시 요청하지 않음)."""
+                if page not in pages and page not in failed:
+                    items = await self._fetch_page_items(client, page)
+                    if items is None:
+                        failed.add(page)
+                    else:
+                        pages[page] = items
+                return pages.get(page)
+
+            def span(items: List[Editorial] | None) -> Tuple[_date, _date] | None:
+                dates = [_date.fromisoformat(e.published_date) for e in items or [] if _valid_date(e.published_date)]
+                return (min(dates), max(dates)) if dates else None
+
+            first = span(await load(1))
+            if first is None or first[1] < target:
+                # 1쪽을 받지 못했거나 비었거나, 가장 최신 사설보다도 미래 날짜
+                return _matching(pages, target_date)
+            newest = first[1]
+
+            # 1) target_date가 들어 있는 쪽 찾기: lo = 전부 더 최신인 쪽, hi = 전부 더 과거(또는 빈) 쪽
+            found = 1
+            if first[0] > target:
+                lo, lo_oldest, hi = 1, first[0], self.max_pages + 1
+                overshot = False
+                found = None
+                while True:
+                    candidates = [p for p in range(lo + 1, hi) if p not in failed]
+                    if not candidates:
+                        break
+                    if overshot:
+                        guess = (lo + hi) // 2
+                    else:
+                        # 1쪽 최신 날짜 ~ lo쪽 가장 과거 날짜의 일수(폭 + 1)로 한 쪽당 일수 추정 (하루가 여러 쪽이면 1 미만)
+                        days_per_page = ((newest - lo_oldest).days + 1) / lo
+                        guess = lo + max(1, round((lo_oldest - target).days / days_per_page))
+                    page = min(candidates, key=lambda p: (abs(p - guess), p))
+                    items = await load(page)
+                    if items is None:
+                        continue
+                    rng = span(items)
+                    if rng is None or rng[1] < target:
+                        hi, overshot = page, True
+                    elif rng[0] > target:
+                        lo, lo_oldest = page, rng[0]
+                    else:
+                        found = page
+                        break
+                if found is None:
+                    # 그날 사설이 없음 (휴간일 등) 또는 해당 범위의 쪽을 모두 받지 못함
+                    return _matching(pages, target_date)
+
+            # 2) 찾은 쪽 앞뒤로 target_date가 이어지는 동안만 더 읽음 (받지 못한 쪽은 건너뜀)
+            last = pages[found]
+            for page in range(found - 1, 0, -1):
+                rng = span(last)
+                if rng is None or rng[1] > target:
+                    break
+                items = await load(page)
+                if items is not None:
+                    last = items
+            last = pages[found]
+            for page in range(found + 1, self.max_pages + 1):
+                rng = span(last)
+                if rng is None or rng[0] < target:
+                    # 이 쪽에 이미 더 과거 사설이 나옴 → 이후 쪽은 전부 과거
+                    break
+                items = await load(page)
+                if items is not None:
+                    if not items:
+                        break
+                    last = items
+        with phase("dedup"):
+            matched = _matching(pages, target_date)
+        record_path("list_html", len(matched))
+        return matched
+
+
+def _valid_date(value: str) -> bool:
+    try:
+        _date.fromisoformat(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _matching(pages: Dict[int, List[Editorial]], target_date: str) -> List[Editorial]:
+    """읽은 쪽들(쪽 번호 순)에서 target_date 사설만, url 기준 중복 제거."""
+    seen = set()
+    return [
+        e
+        for page in sorted(pages)
+        for e in pages[page]
+        if e.published_date == target_date and e.url not in seen and not seen.add(e.url)
+    ]
+
 
 def parse_rss_to_editorials(xml_text: str, source_name: str) -> List[Editorial]:
     """RSS/Atom XML 문자열을 파싱해 Editorial 리스트로 반환.
@@ -0,0 +1,255 @@
+"""Playwright Chromium 공유 풀.
+   앱 시작(lifespan) 시 Chromium을 한 번만 띄우고, 스크래퍼는 컨텍스트를 빌려 페이지만 열고 닫음.
+   동시 페이지 수는 BROWSER_POOL_SIZE로 제한 → 트래픽이 몰려도 Chromium 프로세스가 늘어나지 않음.
+"""
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from app.metrics import playwright_active_pages, playwright_up
+from app.timings import phase
+
+# 동시에 열 수 있는 페이지(=빌려줄 컨텍스트) 수
+BROWSER_POOL_SIZE = max(1, int(os.environ.get("BROWSER_POOL_SIZE", "2")))
+# 브라우저 생존 확인 주기(초)
+BROWSER_HEALTH_INTERVAL = 60
+# 컨텍스트를 이 횟수만큼 쓰면 닫고 새로 만듦 (쿠키·캐시·메모리 누적 방지)
+BROWSER_CONTEXT_MAX_USES = 30
+# Playwright/Chromium 미설치로 실행 실패 시 재시도까지 대기(초)
+BROWSER_RETRY_AFTER = 300
+# 기사 링크만 필요하므로 이미지·폰트·광고·분석 요청은 막음 (0이면 모두 허용)
+BROWSER_BLOCK_RESOURCES = (os.environ.get("BROWSER_BLOCK_RESOURCES") or "1").strip().lower() not in ("0", "false", "no")
+
+# 링크 추출에 필요 없는 리소스 종류 (Playwright request.resource_type)
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "ping", "manifest", "texttrack"})
+# 광고·분석·추적 도메인 (호스트에 포함되면 차단)
+BLOCKED_DOMAINS = (
+    "doubleclick.net", "googlesyndication.com", "googleadservices.com", "google-analytics.com",
+    "googletagmanager.com", "googletagservices.com", "adservice.google.", "facebook.net",
+    "facebook.com", "criteo.", "scorecardresearch.com", "adnxs.com", "taboola.com",
+    "outbrain.com", "dable.io", "mobon.net", "kakao.ad", "analytics.", "veta.naver.com",
+    "adcr.naver.com", "tivan.naver.com", "nelo2-col.navercorp.com",
+)
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """페이지에서 허용할 요청 정책. allowed_domains가 있으면 그 도메인(하위 도메인 포함)만 허용."""
+
+    allowed_domains: tuple[str, ...] = ()
+    blocked_types: frozenset = BLOCKED_RESOURCE_TYPES
+    blocked_domains: tuple[str, ...] = BLOCKED_DOMAINS
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        if resource_type == "document":
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        host = (urlsplit(url).hostname or "").lower()
+        if not host:
+            return False
+        if any(d in host for d in self.blocked_domains):
+            return True
+        if self.allowed_domains:
+            return not any(host == d or host.endswith("." + d) for d in self.allowed_domains)
+        return False
+
+
+DEFAULT_RESOURCE_POLICY = ResourcePolicy()
+
+
+class BrowserPool:
+    """Chromium 1개 + 재사용 컨텍스트 풀. 죽은 브라우저는 다음 요청·헬스체크 때 다시 띄움."""
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE):
+        self.size = size
+        self._playwright = None
+        self._browser = None
+        self._generation = 0  # 브라우저를 새로 띄울 때마다 증가 (이전 브라우저의 컨텍스트 폐기용)
+        self._idle: list[tuple[int, object, int]] = []  # (generation, context, uses)
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(size)
+        self._health_task: asyncio.Task | None = None
+        self._unavailable_until = 0.0
+        self.active_pages = 0
+        self.restarts = 0
+        self.blocked_requests = 0
+        self.last_error: str | None = None
+
+    async def start(self) -> bool:
+        """브라우저 실행 및 헬스체크 시작. Playwright가 없으면 False (스크래퍼는 httpx 경로 사용)."""
+        ok = await self._ensure_browser()
+        if self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+        return ok
+
+    async def stop(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        async with self._lock:
+            await self._close_browser()
+
+    def is_healthy(self) -> bool:
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _ensure_browser(self) -> bool:
+        if self.is_healthy():
+            return True
+        if time.monotonic() < self._unavailable_until:
+            return False
+        async with self._lock:
+            if self.is_healthy():
+                return True
+            restarting = self._browser is not None
+            await self._close_browser()
+            try:
+                from playwright.async_api import async_playwright
+            except ImportError:
+                self.last_error = "playwright 미설치"
+                self._unavailable_until = time.monotonic() + BROWSER_RETRY_AFTER
+                return False
+            try:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+            except Exception as e:
+                self.last_error = str(e)[:200]
+                self._unavailable_until = time.monotonic() + BROWSER_RETRY_AFTER
+                await self._close_browser()
+                err = str(e).lower()
+                if "executable" in err or "browser" in err or "chromium" in err:
+                    print("[브라우저 풀] Chromium 미설치 가능성. 터미널에서: playwright install chromium")
+                return False
+            self._generation += 1
+            if restarting:
+                self.restarts += 1
+                print(f"[브라우저 풀] Chromium 재시작 ({self.restarts}회)")
+            self.last_error = None
+            return True
+
+    async def _close_browser(self) -> None:
+        """브라우저·Playwright 정리. 호출 측에서 _lock을 잡고 있어야 함."""
+        idle, self._idle = self._idle, []
+        for _, context, _ in idle:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    async def _acquire_context(self) -> tuple[int, object, int] | None:
+        if not await self._ensure_browser():
+            return None
+        while self._idle:
+            generation, context, uses = self._idle.pop()
+            if generation == self._generation:
+                return generation, context, uses
+            try:
+                await context.close()
+            except Exception:
+                pass
+        context = await self._browser.new_context()
+        return self._generation, context, 0
+
+    async def _release_context(self, generation: int, context, uses: int, broken: bool) -> None:
+        if broken or generation != self._generation or uses >= BROWSER_CONTEXT_MAX_USES or not self.is_healthy():
+            try:
+                await context.close()
+            except Exception:
+                pass
+            return
+        self._idle.append((generation, context, uses))
+
+    async def _apply_policy(self, page, policy: ResourcePolicy) -> None:
+        async def _route(route):
+            request = route.request
+            try:
+                if policy.should_block(request.url, request.resource_type):
+                    self.blocked_requests += 1
+                    await route.abort()
+                else:
+                    await route.continue_()
+            except Exception:
+                # 페이지가 이미 닫힌 경우 등
+                pass
+
+        await page.route("**/*", _route)
+
+    @asynccontextmanager
+    async def page(self, policy: ResourcePolicy | None = DEFAULT_RESOURCE_POLICY):
+        """페이지 하나를 빌려줌. Playwright를 쓸 수 없으면 None을 yield.
+        policy로 불필요한 요청(이미지·폰트·광고·제3자 도메인)을 차단. None이면 모두 허용."""
+        with phase("playwright"):
+            async with self._slots:
+                acquired = None
+                try:
+                    acquired = await self._acquire_context()
+                except Exception as e:
+                    self.last_error = str(e)[:200]
+                if acquired is None:
+                    yield None
+                    return
+                generation, context, uses = acquired
+                page = None
+                broken = False
+                try:
+                    page = await context.new_page()
+                    self.active_pages += 1
+                    if policy is not None and BROWSER_BLOCK_RESOURCES:
+                        await self._apply_policy(page, policy)
+                    yield page
+                except Exception:
+                    broken = not self.is_healthy()
+                    raise
+                finally:
+                    if page is not None:
+                        self.active_pages -= 1
+                        try:
+                            await page.close()
+                        except Exception:
+                            broken = True
+                    await self._release_context(generation, context, uses + 1, broken)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(BROWSER_HEALTH_INTERVAL)
+            try:
+                if self._browser is not None and not self.is_healthy():
+                    print("[브라우저 풀] Chromium 연결 끊김 감지 → 재시작")
+                    await self._ensure_browser()
+            except Exception as e:
+                self.last_error = str(e)[:200]
+
+    def status(self) -> dict:
+        return {
+            "healthy": self.is_healthy(),
+            "size": self.size,
+            "active_pages": self.active_pages,
+            "idle_contexts": len(self._idle),
+            "restarts": self.restarts,
+            "blocked_requests": self.blocked_requests,
+            "last_error": self.last_error,
+        }
+
+
+browser_pool = BrowserPool()
+playwright_active_pages.set_function(lambda: browser_pool.active_pages)
+playwright_up.set_function(lambda: int(browser_pool.is_healthy()))
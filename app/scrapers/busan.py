@@ -2,11 +2,8 @@
 import re
 from typing import List
 
-import httpx
-from bs4 import BeautifulSoup
-
 from app.models import Editorial
-from app.scrapers.base import BaseScraper, BROWSER_HEADERS
+from app.scrapers.base import BaseScraper, make_soup
 
 # 부산일보 오피니언/사설: opinionmain, 기사는 view/busan/view.php?code=YYYYMMDD...
 LIST_URL = "https://www.busan.com/opinionmain/"
@@ -27,7 +24,7 @@ def _ancestor_contains(a, needle: str, max_depth: int = 15) -> bool:
 
 def _parse_busan_html(html: str, source_name: str) -> List[Editorial]:
     results: List[Editorial] = []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     # view.php?code= 형태 링크 (부산일보 기사 공통)
     for a in soup.select("a[href*='code=']"):
         href = (a.get("href") or "").strip()
@@ -70,32 +67,15 @@ class BusanScraper(BaseScraper):
     page_param = None  # URL이 /opinionmain/1/, /opinionmain/2/ 형태일 수 있음
     max_pages = 12
     max_items = 200
+    newest_first = True
 
     def page_url(self, page: int) -> str:
         if page <= 1:
             return self.list_url.rstrip("/") + "/"
         return self.list_url.rstrip("/") + "/" + str(page) + "/"
 
-    async def fetch_editorials(self) -> List[Editorial]:
-        results: List[Editorial] = []
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            headers=BROWSER_HEADERS,
-            timeout=20.0,
-        ) as client:
-            for page in range(1, self.max_pages + 1):
-                url = self.page_url(page)
-                try:
-                    r = await client.get(url)
-                    r.raise_for_status()
-                    results.extend(_parse_busan_html(r.text, self.source_name))
-                except Exception:
-                    if page == 1:
-                        return results
-                    break
-        seen = set()
-        return [e for e in results if e.url not in seen and not seen.add(e.url)][: self.max_items]
+    def parse_page(self, html: str) -> List[Editorial]:
+        return _parse_busan_html(html, self.source_name)
 
-    async def fetch_editorials_for_date(self, target_date: str) -> List[Editorial]:
-        all_ = await self.fetch_editorials()
-        return [e for e in all_ if e.published_date == target_date]
+    async def fetch_editorials(self) -> List[Editorial]:
+        return await self.fetch_list_pages()
@@ -3,55 +3,49 @@ import asyncio
 import re
 from typing import List
 
-import httpx
-from bs4 import BeautifulSoup
-
+from app.http_clients import http_session
 from app.models import Editorial
-from app.scrapers.base import BaseScraper, BROWSER_HEADERS, parse_rss_to_editorials, RSS_HEADERS
+from app.parse_executor import parse_executor
+from app.scrapers.base import BaseScraper, BROWSER_HEADERS, parse_rss_to_editorials, RSS_HEADERS, make_soup
+from app.scrapers.browser import ResourcePolicy, browser_pool
+from app.timings import record_path
 
 EDITORIAL_LIST_URL = "https://www.chosun.com/opinion/editorial/"
 # 오피니언 RSS(사설·칼럼 포함) - 사설만 필터해 사용
 CHOSUN_OPINION_RSS = "https://www.chosun.com/arc/outboundfeeds/rss/category/opinion/?outputType=xml"
 
+# 조선일보 목록: 자사 도메인과 Arc 퍼블리싱 CDN만 허용
+CHOSUN_RESOURCE_POLICY = ResourcePolicy(allowed_domains=("chosun.com", "arcpublishing.com"))
+
 
 async def _fetch_html_playwright(url: str) -> str | None:
     """Playwright로 페이지 렌더 후 HTML 반환. (Chromium 필요: playwright install chromium)"""
     try:
-        from playwright.async_api import async_playwright
-    except ImportError:
-        return None
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
+        async with browser_pool.page(CHOSUN_RESOURCE_POLICY) as page:
+            if page is None:
+                return None
+            await page.goto(url, wait_until="load", timeout=30000)
             try:
-                page = await browser.new_page()
-                await page.goto(url, wait_until="load", timeout=30000)
-                try:
-                    await page.wait_for_selector(
-                        "a[href*='/opinion/editorial/']",
-                        timeout=15000,
-                        state="attached",
-                    )
-                except Exception:
-                    pass
-                await asyncio.sleep(1.5)
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(1.0)
-                return await page.content()
-            finally:
-                await browser.close()
-    except Exception as e:
-        err = str(e).lower()
-        if "executable" in err or "browser" in err or "chromium" in err:
-            print("[조선일보] Playwright Chromium 미설치 가능성. 터미널에서: playwright install chromium")
+                await page.wait_for_selector(
+                    "a[href*='/opinion/editorial/']",
+                    timeout=15000,
+                    state="attached",
+                )
+            except Exception:
+                pass
+            await asyncio.sleep(1.5)
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await asyncio.sleep(1.0)
+            return await page.content()
+    except Exception:
         return None
 
 
 async def _fetch_html_httpx(url: str) -> str | None:
     """httpx로 HTML 받기 (JS 미렌더링이면 목록이 비어 있을 수 있음)."""
     try:
-        async with httpx.AsyncClient(
-            follow_redirects=True,
+        async with http_session(
+            url,
             headers={**BROWSER_HEADERS, "Referer": "https://www.chosun.com/"},
             timeout=15.0,
         ) as client:
@@ -65,7 +59,7 @@ async def _fetch_html_httpx(url: str) -> str | None:
 def _parse_chosun_page(html: str, source_name: str) -> List[Editorial]:
     """조선일보 목록 HTML 한 페이지에서 사설 추출."""
     results: List[Editorial] = []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     for item in soup.select("a[href*='/opinion/editorial/']"):
         href = item.get("href") or ""
         if not href.startswith("http"):
@@ -110,16 +104,24 @@ class ChosunScraper(BaseScraper):
     page_param = "page"
     max_pages = 18  # 12월 등 2~3개월 전 날짜까지 도달
     max_items = 250
+    newest_first = True
+
+    def parse_page(self, html: str) -> List[Editorial]:
+        return _parse_chosun_page(html, self.source_name)
+
+    async def fetch_page_html(self, client, page: int) -> str | None:
+        url = self.page_url(page)
+        return await _fetch_html_playwright(url) or await _fetch_html_httpx(url)
 
     async def fetch_editorials(self) -> List[Editorial]:
         # 1) RSS 우선 시도 (서버에서 Playwright 미설치 시에도 동작)
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True, headers=RSS_HEADERS, timeout=20.0
+            async with self.http_session(
+                CHOSUN_OPINION_RSS, headers=RSS_HEADERS, timeout=20.0
             ) as client:
                 r = await client.get(CHOSUN_OPINION_RSS)
                 if r.status_code == 200 and r.text.strip():
-                    all_items = parse_rss_to_editorials(r.text, self.source_name)
+                    all_items = await parse_executor.run(parse_rss_to_editorials, r.text, self.source_name)
                     # 사설만: 제목에 [사설] 또는 URL에 /opinion/editorial/
                     editorial_only = [
                         e for e in all_items
@@ -127,37 +129,25 @@ class ChosunScraper(BaseScraper):
                     ]
                     if editorial_only:
                         seen = set()
-                        unique = [e for e in editorial_only if e.url not in seen and not seen.add(e.url)]
-                        return unique[: self.max_items]
+                        unique = [e for e in editorial_only if e.url not in seen and not seen.add(e.url)][: self.max_items]
+                        record_path("rss", len(unique))
+                        return unique
         except Exception:
             pass
 
         # 2) 기존 HTML 방식 (Playwright → httpx)
-        results: List[Editorial] = []
-        for page in range(1, self.max_pages + 1):
-            url = self.page_url(page)
-            html = await _fetch_html_playwright(url)
-            if not html:
-                html = await _fetch_html_httpx(url)
-            if not html:
-                if page == 1:
-                    return results
-                break
-            results.extend(_parse_chosun_page(html, self.source_name))
-        seen = set()
-        unique = [e for e in results if e.url not in seen and not seen.add(e.url)]
-        return unique[: self.max_items]
+        return await self.fetch_list_pages()
 
     async def fetch_editorials_for_date(self, target_date: str) -> List[Editorial]:
         """해당 날짜(YYYY-MM-DD) 사설만 수집. RSS 우선, 없으면 HTML."""
         # RSS로 전체 수집 후 날짜 필터
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True, headers=RSS_HEADERS, timeout=20.0
+            async with self.http_session(
+                CHOSUN_OPINION_RSS, headers=RSS_HEADERS, timeout=20.0
             ) as client:
                 r = await client.get(CHOSUN_OPINION_RSS)
                 if r.status_code == 200 and r.text.strip():
-                    all_items = parse_rss_to_editorials(r.text, self.source_name)
+                    all_items = await parse_executor.run(parse_rss_to_editorials, r.text, self.source_name)
                     editorial_only = [
                         e for e in all_items
                         if ("[사설]" in (e.title or "") or "/opinion/editorial/" in (e.url or ""))
@@ -165,28 +155,10 @@ class ChosunScraper(BaseScraper):
                     ]
                     if editorial_only:
                         seen = set()
-                        return [e for e in editorial_only if e.url not in seen and not seen.add(e.url)]
+                        unique = [e for e in editorial_only if e.url not in seen and not seen.add(e.url)]
+                        record_path("rss", len(unique))
+                        return unique
         except Exception:
             pass
 
-        results: List[Editorial] = []
-        for page in range(1, self.max_pages + 1):
-            url = self.page_url(page)
-            html = await _fetch_html_playwright(url)
-            if not html:
-                html = await _fetch_html_httpx(url)
-            if not html:
-                if page == 1:
-                    return results
-                break
-            passed_target = False
-            for e in _parse_chosun_page(html, self.source_name):
-                if e.published_date < target_date:
-                    passed_target = True
-                    continue
-                if e.published_date == target_date:
-                    results.append(e)
-            if passed_target:
-                break
-        seen = set()
-        return [e for e in results if e.url not in seen and not seen.add(e.url)]
+        return await self.paginate_for_date(target_date)
@@ -3,48 +3,45 @@ import asyncio
 import re
 from typing import List
 
-import httpx
-from bs4 import BeautifulSoup
-
+from app.http_clients import http_session
 from app.models import Editorial
-from app.scrapers.base import BaseScraper, BROWSER_HEADERS, parse_rss_to_editorials, RSS_HEADERS
+from app.parse_executor import parse_executor
+from app.scrapers.base import BaseScraper, BROWSER_HEADERS, parse_rss_to_editorials, RSS_HEADERS, make_soup
+from app.scrapers.browser import ResourcePolicy, browser_pool
+from app.timings import record_path
 
 LIST_URL = "https://www.donga.com/news/List/700401"  # 사설/칼럼 PC
 LIST_URL_MOBILE = "https://www.donga.com/news/m/List_0401"  # 모바일 (서버 렌더일 수 있음)
 DONGA_EDITORIALS_RSS = "https://rss.donga.com/editorials.xml"  # 사설칼럼 RSS (일시 500 가능)
 
+# 동아일보 목록: 자사 도메인만 허용
+DONGA_RESOURCE_POLICY = ResourcePolicy(allowed_domains=("donga.com",))
+
 
 async def _fetch_html_playwright(url: str) -> str | None:
     """Playwright로 페이지 렌더 후 HTML 반환. 동아일보 목록은 JS 로드라 브라우저 필요."""
     try:
-        from playwright.async_api import async_playwright
-    except ImportError:
-        return None
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
+        async with browser_pool.page(DONGA_RESOURCE_POLICY) as page:
+            if page is None:
+                return None
+            await page.goto(url, wait_until="domcontentloaded", timeout=25000)
+            # 목록/제목 로딩 대기 (선택자 실패해도 계속 진행)
             try:
-                page = await browser.new_page()
-                await page.goto(url, wait_until="domcontentloaded", timeout=25000)
-                # 목록/제목 로딩 대기 (선택자 실패해도 계속 진행)
-                try:
-                    await page.wait_for_selector("h4, a[href*='article'], [class*='tit'], [class*='title']", timeout=10000)
-                except Exception:
-                    pass
-                await asyncio.sleep(1.5)
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(0.8)
-                return await page.content()
-            finally:
-                await browser.close()
+                await page.wait_for_selector("h4, a[href*='article'], [class*='tit'], [class*='title']", timeout=10000)
+            except Exception:
+                pass
+            await asyncio.sleep(1.5)
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await asyncio.sleep(0.8)
+            return await page.content()
     except Exception:
         return None
 
 
 async def _fetch_html_httpx(url: str) -> str | None:
     try:
-        async with httpx.AsyncClient(
-            follow_redirects=True,
+        async with http_session(
+            url,
             headers={**BROWSER_HEADERS, "Referer": "https://www.donga.com/"},
             timeout=15.0,
         ) as client:
@@ -63,7 +60,7 @@ _DATE_IN_URL_ALT = re.compile(r"/(\d{4})(\d{2})(\d{2})/\d+", re.I)  # /YYYYMMDD/
 def _parse_donga_page(html: str, source_name: str) -> List[Editorial]:
     """동아일보 목록 HTML에서 사설만 추출. [사설] 제목 또는 article/all/ 날짜 링크 기준."""
     results: List[Editorial] = []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     seen_urls: set[str] = set()
 
     def add_editorial(href: str, title: str, date: str) -> None:
@@ -142,17 +139,18 @@ class DongaScraper(BaseScraper):
     async def fetch_editorials(self) -> List[Editorial]:
         # 1) RSS 시도 (사설만 필터: 제목에 [사설] 있는 것만)
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True, headers=RSS_HEADERS, timeout=20.0
+            async with self.http_session(
+                DONGA_EDITORIALS_RSS, headers=RSS_HEADERS, timeout=20.0
             ) as client:
                 r = await client.get(DONGA_EDITORIALS_RSS)
                 if r.status_code == 200 and r.text.strip():
-                    items = parse_rss_to_editorials(r.text, self.source_name)
+                    items = await parse_executor.run(parse_rss_to_editorials, r.text, self.source_name)
                     editorial_only = [e for e in items if e.title and "[사설]" in e.title]
                     if editorial_only:
                         seen = set()
-                        unique = [e for e in editorial_only if e.url not in seen and not seen.add(e.url)]
-                        return unique[: self.max_items]
+                        unique = [e for e in editorial_only if e.url not in seen and not seen.add(e.url)][: self.max_items]
+                        record_path("rss", len(unique))
+                        return unique
         except Exception:
             pass
 
@@ -163,7 +161,7 @@ class DongaScraper(BaseScraper):
             url = self.page_url(page)
             if page == 1:
                 html = await _fetch_html_httpx(LIST_URL_MOBILE)
-                if html and _parse_donga_page(html, self.source_name):
+                if html and await parse_executor.run(_parse_donga_page, html, self.source_name):
                     use_mobile = True
                 if not html or not use_mobile:
                     html = await _fetch_html_playwright(url) or html or await _fetch_html_httpx(url)
@@ -178,25 +176,28 @@ class DongaScraper(BaseScraper):
                 if page == 1:
                     return []
                 break
-            results.extend(_parse_donga_page(html, self.source_name))
+            results.extend(await parse_executor.run(_parse_donga_page, html, self.source_name))
         seen = set()
-        unique = [e for e in results if e.url not in seen and not seen.add(e.url)]
-        return unique[: self.max_items]
+        unique = [e for e in results if e.url not in seen and not seen.add(e.url)][: self.max_items]
+        record_path("list_html", len(unique))
+        return unique
 
     async def fetch_editorials_for_date(self, target_date: str) -> List[Editorial]:
         """해당 날짜(YYYY-MM-DD) 사설만 수집. RSS 우선."""
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True, headers=RSS_HEADERS, timeout=20.0
+            async with self.http_session(
+                DONGA_EDITORIALS_RSS, headers=RSS_HEADERS, timeout=20.0
             ) as client:
                 r = await client.get(DONGA_EDITORIALS_RSS)
                 if r.status_code == 200 and r.text.strip():
-                    items = parse_rss_to_editorials(r.text, self.source_name)
+                    items = await parse_executor.run(parse_rss_to_editorials, r.text, self.source_name)
                     editorial_only = [e for e in items if e.title and "[사설]" in e.title]
                     by_date = [e for e in editorial_only if e.published_date == target_date]
                     if by_date:
                         seen = set()
-                        return [e for e in by_date if e.url not in seen and not seen.add(e.url)]
+                        unique = [e for e in by_date if e.url not in seen and not seen.add(e.url)]
+                        record_path("rss", len(unique))
+                        return unique
         except Exception:
             pass
 
@@ -207,12 +208,12 @@ class DongaScraper(BaseScraper):
             if page == 1:
                 for attempt in range(2):
                     html = await _fetch_html_httpx(LIST_URL_MOBILE)
-                    if html and _parse_donga_page(html, self.source_name):
+                    if html and await parse_executor.run(_parse_donga_page, html, self.source_name):
                         use_mobile = True
                         break
                     if not html or not use_mobile:
                         html = await _fetch_html_playwright(url) or html or await _fetch_html_httpx(url)
-                    if html and _parse_donga_page(html, self.source_name):
+                    if html and await parse_executor.run(_parse_donga_page, html, self.source_name):
                         break
                     if attempt == 0:
                         await asyncio.sleep(1.0)
@@ -228,7 +229,7 @@ class DongaScraper(BaseScraper):
                     return results
                 break
             passed_target = False
-            for e in _parse_donga_page(html, self.source_name):
+            for e in await parse_executor.run(_parse_donga_page, html, self.source_name):
                 if e.published_date < target_date:
                     passed_target = True
                     continue
@@ -237,4 +238,6 @@ class DongaScraper(BaseScraper):
             if passed_target:
                 break
         seen = set()
-        return [e for e in results if e.url not in seen and not seen.add(e.url)]
+        unique = [e for e in results if e.url not in seen and not seen.add(e.url)]
+        record_path("list_html", len(unique))
+        return unique
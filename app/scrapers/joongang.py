@@ -3,32 +3,27 @@ import asyncio
 import re
 from typing import List
 
-import httpx
-from bs4 import BeautifulSoup
-
 from app.models import Editorial
-from app.scrapers.base import BaseScraper, BROWSER_HEADERS
+from app.parse_executor import parse_executor
+from app.scrapers.base import BaseScraper, make_soup
+from app.scrapers.browser import ResourcePolicy, browser_pool
 
 LIST_URL = "https://www.joongang.co.kr/opinion/editorial"
 
+# 중앙일보 목록: 자사 도메인만 허용
+JOONGANG_RESOURCE_POLICY = ResourcePolicy(allowed_domains=("joongang.co.kr", "joins.com"))
+
 
 async def _fetch_joongang_playwright(url: str) -> str | None:
     """목록이 JS 로드일 때 Playwright로 HTML 수집."""
     try:
-        from playwright.async_api import async_playwright
-    except ImportError:
-        return None
-    try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                page = await browser.new_page()
-                await page.goto(url, wait_until="load", timeout=20000)
-                await page.wait_for_selector("a[href*='/article/']", timeout=10000)
-                await asyncio.sleep(0.8)
-                return await page.content()
-            finally:
-                await browser.close()
+        async with browser_pool.page(JOONGANG_RESOURCE_POLICY) as page:
+            if page is None:
+                return None
+            await page.goto(url, wait_until="load", timeout=20000)
+            await page.wait_for_selector("a[href*='/article/']", timeout=10000)
+            await asyncio.sleep(0.8)
+            return await page.content()
     except Exception:
         return None
 
@@ -36,7 +31,7 @@ async def _fetch_joongang_playwright(url: str) -> str | None:
 def _parse_joongang_html(html: str, source_name: str) -> List[Editorial]:
     """HTML에서 /article/ 링크로 사설 목록 추출."""
     results: List[Editorial] = []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     for a in soup.select("a[href*='/article/']"):
         href = a.get("href") or ""
         if not href.startswith("http"):
@@ -86,69 +81,20 @@ class JoongangScraper(BaseScraper):
     list_url = LIST_URL
     max_pages = 18
     max_items = 250
+    newest_first = True
 
-    async def fetch_editorials(self) -> List[Editorial]:
-        results: List[Editorial] = []
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            headers=BROWSER_HEADERS,
-            timeout=20.0,
-        ) as client:
-            for page in range(1, self.max_pages + 1):
-                url = self.page_url(page)
-                html = None
-                try:
-                    r = await client.get(url)
-                    r.raise_for_status()
-                    html = r.text
-                except Exception:
-                    if page == 1:
-                        return results
-                    break
-                if page == 1 and not _parse_joongang_html(html, self.source_name):
-                    html = await _fetch_joongang_playwright(url)
-                if not html:
-                    if page == 1:
-                        return results
-                    break
-                results.extend(_parse_joongang_html(html, self.source_name))
-        seen = set()
-        unique = [e for e in results if e.url not in seen and not seen.add(e.url)]
-        return unique[: self.max_items]
+    def parse_page(self, html: str) -> List[Editorial]:
+        return _parse_joongang_html(html, self.source_name)
 
-    async def fetch_editorials_for_date(self, target_date: str) -> List[Editorial]:
-        """해당 날짜(YYYY-MM-DD) 사설만 수집. 목록이 최신순이므로 그보다 과거가 나오면 중단."""
-        results: List[Editorial] = []
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            headers=BROWSER_HEADERS,
-            timeout=20.0,
-        ) as client:
-            for page in range(1, self.max_pages + 1):
-                url = self.page_url(page)
-                html = None
-                try:
-                    r = await client.get(url)
-                    r.raise_for_status()
-                    html = r.text
-                except Exception:
-                    if page == 1:
-                        return results
-                    break
-                if page == 1 and not _parse_joongang_html(html, self.source_name):
-                    html = await _fetch_joongang_playwright(url)
-                if not html:
-                    if page == 1:
-                        return results
-                    break
-                passed_target = False
-                for e in _parse_joongang_html(html, self.source_name):
-                    if e.published_date < target_date:
-                        passed_target = True
-                        continue
-                    if e.published_date == target_date:
-                        results.append(e)
-                if passed_target:
-                    break
-        seen = set()
-        return [e for e in results if e.url not in seen and not seen.add(e.url)]
+    async def fetch_page_html(self, client, page: int) -> str | None:
+        url = self.page_url(page)
+        r = await client.get(url)
+        r.raise_for_status()
+        html = r.text
+        if page == 1 and not await parse_executor.run(_parse_joongang_html, html, self.source_name):
+            # 목록이 JS 로드일 때
+            html = await _fetch_joongang_playwright(url)
+        return html
+
+    async def fetch_editorials(self) -> List[Editorial]:
+        return await self.fetch_list_pages()
@@ -2,18 +2,15 @@
 import re
 from typing import List
 
-import httpx
-from bs4 import BeautifulSoup
-
 from app.models import Editorial
-from app.scrapers.base import BaseScraper, BROWSER_HEADERS
+from app.scrapers.base import BaseScraper, make_soup
 
 LIST_URL = "https://www.kmib.co.kr/article/listing.asp?sid1=opi"
 
 
 def _parse_kmib_html(html: str, source_name: str) -> List[Editorial]:
     results: List[Editorial] = []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     for a in soup.select("a[href*='view.asp'], a[href*='arcid=']"):
         href = (a.get("href") or "").strip()
         if "arcid=" not in href:
@@ -72,27 +69,10 @@ class KmibScraper(BaseScraper):
     page_param = "page"
     max_pages = 12
     max_items = 200
+    newest_first = True
 
-    async def fetch_editorials(self) -> List[Editorial]:
-        results: List[Editorial] = []
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            headers=BROWSER_HEADERS,
-            timeout=20.0,
-        ) as client:
-            for page in range(1, self.max_pages + 1):
-                url = self.page_url(page)
-                try:
-                    r = await client.get(url)
-                    r.raise_for_status()
-                    results.extend(_parse_kmib_html(r.text, self.source_name))
-                except Exception:
-                    if page == 1:
-                        return results
-                    break
-        seen = set()
-        return [e for e in results if e.url not in seen and not seen.add(e.url)][: self.max_items]
+    def parse_page(self, html: str) -> List[Editorial]:
+        return _parse_kmib_html(html, self.source_name)
 
-    async def fetch_editorials_for_date(self, target_date: str) -> List[Editorial]:
-        all_ = await self.fetch_editorials()
-        return [e for e in all_ if e.published_date == target_date]
+    async def fetch_editorials(self) -> List[Editorial]:
+        return await self.fetch_list_pages()
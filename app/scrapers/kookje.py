@@ -2,11 +2,8 @@
 import re
 from typing import List
 
-import httpx
-from bs4 import BeautifulSoup
-
 from app.models import Editorial
-from app.scrapers.base import BaseScraper, BROWSER_HEADERS
+from app.scrapers.base import BaseScraper, make_soup
 
 # 국제신문 사설 목록 (code=1710)
 LIST_URL = "https://www.kookje.co.kr/news2011/asp/list.asp?code=1710"
@@ -15,7 +12,7 @@ BASE_URL = "https://www.kookje.co.kr"
 
 def _parse_kookje_html(html: str, source_name: str) -> List[Editorial]:
     results: List[Editorial] = []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     for a in soup.select("a[href*='newsbody.asp']"):
         href = (a.get("href") or "").strip()
         if not href or "javascript" in href:
@@ -69,32 +66,19 @@ class KookjeScraper(BaseScraper):
     page_param = "page"
     max_pages = 12
     max_items = 200
+    newest_first = True
 
-    async def fetch_editorials(self) -> List[Editorial]:
-        results: List[Editorial] = []
-        async with httpx.AsyncClient(
-            follow_redirects=True,
-            headers=BROWSER_HEADERS,
-            timeout=20.0,
-        ) as client:
-            for page in range(1, self.max_pages + 1):
-                url = self.page_url(page)
-                try:
-                    r = await client.get(url)
-                    r.raise_for_status()
-                    # 국제신문은 EUC-KR/CP949 인코딩 사용 → UTF-8로 디코딩 후 파싱
-                    try:
-                        html = r.content.decode("euc-kr")
-                    except (UnicodeDecodeError, LookupError):
-                        html = r.content.decode("cp949", errors="replace")
-                    results.extend(_parse_kookje_html(html, self.source_name))
-                except Exception:
-                    if page == 1:
-                        return results
-                    break
-        seen = set()
-        return [e for e in results if e.url not in seen and not seen.add(e.url)][: self.max_items]
+    def parse_page(self, html: str) -> List[Editorial]:
+        return _parse_kookje_html(html, self.source_name)
 
-    async def fetch_editorials_for_date(self, target_date: str) -> List[Editorial]:
-        all_ = await self.fetch_editorials()
-        return [e for e in all_ if e.published_date == target_date]
+    async def fetch_page_html(self, client, page: int) -> str | None:
+        r = await client.get(self.page_url(page))
+        r.raise_for_status()
+        # 국제신문은 EUC-KR/CP949 인코딩 사용 → UTF-8로 디코딩 후 파싱
+        try:
+            return r.content.decode("euc-kr")
+        except (UnicodeDecodeError, LookupError):
+            return r.content.decode("cp949", errors="replace")
+
+    async def fetch_editorials(self) -> List[Editorial]:
+        return await self.fetch_list_pages()
@@ -1,18 +1,19 @@
 """네이버 오피니언 사설 수집.
-   [방식 1] Playwright로 사설 탭 페이지를 열고 끝까지 스크롤해 로드된 전체 HTML에서
-            mnews/article 링크를 모두 추출 → 네이버에 보이는 것과 동일한 목록·개수.
+   [방식 1] Playwright로 사설 탭 페이지를 열고 끝까지 스크롤하면서 새로 로드된
+            mnews/article 링크만 브라우저 안에서 모음 → 네이버에 보이는 것과 동일한 목록·개수.
    [방식 2] Playwright 미사용 시: editorial 페이지(httpx) + list.naver 페이지네이션 보조,
             제목은 항상 채우도록 보정.
 """
 import asyncio
 import re
-from typing import List, Set, Tuple
-
-import httpx
-from bs4 import BeautifulSoup
+from typing import Iterable, List, Set, Tuple
 
+from app.metrics import scraper_pages
 from app.models import Editorial
-from app.scrapers.base import BaseScraper, BROWSER_HEADERS
+from app.parse_executor import parse_executor
+from app.timings import phase, record_path
+from app.scrapers.base import BaseScraper, BROWSER_HEADERS, iter_links, make_soup
+from app.scrapers.browser import ResourcePolicy, browser_pool
 
 NAVER_EDITORIAL_URL = "https://news.naver.com/opinion/editorial"
 NAVER_LIST_URL = "https://news.naver.com/main/list.naver"
@@ -108,11 +109,16 @@ def _oid_from_url(href: str) -> str:
 
 def _parse_editorial_page_html(html: str, date: str) -> List[Editorial]:
     """사설 탭 HTML(전체 로드된 상태)에서 mnews/article 링크만 추출. 형식: 신문사명 제목 N시간전."""
-    soup = BeautifulSoup(html, "html.parser")
+    # 링크만 필요하므로 전체 트리 대신 빠른 링크 추출 경로 사용
+    return _editorials_from_links(iter_links(html), date)
+
+
+def _editorials_from_links(links: Iterable[Tuple[str, str]], date: str) -> List[Editorial]:
+    """(href, 링크 텍스트) 목록 → Editorial. HTML 파싱 결과와 브라우저에서 직접 모은 링크 모두 사용."""
     seen: Set[str] = set()
     results: List[Editorial] = []
-    for a in soup.find_all("a", href=True):
-        href = (a.get("href") or "").strip()
+    for href, text in links:
+        href = href.strip()
         if "n.news.naver.com/mnews/article/" not in href:
             continue
         if not href.startswith("http"):
@@ -122,7 +128,6 @@ def _parse_editorial_page_html(html: str, date: str) -> List[Editorial]:
         if href in seen:
             continue
         seen.add(href)
-        text = a.get_text(strip=True)
         oid = _oid_from_url(href)
         source_hint = NAVER_OID_NAMES.get(oid, "")
         source, title = _parse_link_text(text, source_hint=source_hint)
@@ -142,10 +147,12 @@ def _parse_editorial_page_html(html: str, date: str) -> List[Editorial]:
     return results
 
 
-def _parse_list_naver_page(html: str, date: str, seen_urls: Set[str]) -> List[Editorial]:
-    """list.naver 한 페이지에서 [사설]/[논설실의 관점] 링크만. 제목 항상 보정."""
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_list_naver_page(html: str, date: str) -> List[Editorial]:
+    """list.naver 한 페이지에서 [사설]/[논설실의 관점] 링크만. 제목 항상 보정.
+    파싱 풀(프로세스)에서 돌 수 있도록 인자를 바꾸지 않음 → 이전 페이지와의 중복 제거는 호출하는 쪽에서."""
+    soup = make_soup(html)
     results: List[Editorial] = []
+    seen_urls: Set[str] = set()
     for a in soup.find_all("a", href=True):
         href = (a.get("href") or "").strip()
         if "mnews/article/" not in href:
@@ -193,53 +200,74 @@ def _parse_list_naver_page(html: str, date: str, seen_urls: Set[str]) -> List[Ed
     return results
 
 
-async def _fetch_full_editorial_with_playwright(url: str) -> str | None:
-    """Playwright로 사설 탭 열고, 기사 링크 수가 더 이상 늘지 않을 때까지 스크롤 후 HTML 반환."""
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError:
-        return None
+# 네이버 사설 탭: 네이버 본문·스크립트(pstatic.net)만 허용
+NAVER_RESOURCE_POLICY = ResourcePolicy(allowed_domains=("naver.com", "naver.net", "pstatic.net"))
+
+
+# 브라우저 안에서 아직 넘기지 않은 기사 링크만 (href, 텍스트)로 모음.
+# 텍스트는 BeautifulSoup get_text(strip=True)와 같은 규칙(텍스트 노드마다 trim 후 이어 붙임)
+_COLLECT_NEW_LINKS_JS = """
+() => {
+  const seen = window.__collectedArticleLinks || (window.__collectedArticleLinks = new Set());
+  const out = [];
+  for (const a of document.querySelectorAll('a[href*="mnews/article/"]')) {
+    const href = a.getAttribute("href") || "";
+    if (seen.has(href)) continue;
+    seen.add(href);
+    let text = "";
+    const walker = document.createTreeWalker(a, NodeFilter.SHOW_TEXT);
+    for (let n = walker.nextNode(); n; n = walker.nextNode()) text += n.nodeValue.trim();
+    out.push([href, text]);
+  }
+  return out;
+}
+"""
+_ARTICLE_LINK_COUNT_GREATER_JS = 'n => document.querySelectorAll(\'a[href*="mnews/article/"]\').length > n'
+
+
+async def _collect_editorial_links_with_playwright(url: str) -> List[Tuple[str, str]] | None:
+    """Playwright로 사설 탭을 열고 스크롤할 때마다 새로 생긴 기사 링크만 모음.
+    고정 대기 대신 링크 수가 늘어나는 것을 기다리고, 더 이상 늘지 않으면 종료. 전체 HTML은 직렬화하지 않음."""
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
+        async with browser_pool.page(NAVER_RESOURCE_POLICY) as page:
+            if page is None:
+                return None
+            await page.goto(url, wait_until="domcontentloaded", timeout=40000)
             try:
-                page = await browser.new_page()
-                await page.goto(url, wait_until="domcontentloaded", timeout=40000)
-                await asyncio.sleep(2.5)
-                last_count = 0
-                stable_rounds = 0
-                max_stable = 4
-                for _ in range(55):
-                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await asyncio.sleep(1.2)
-                    try:
-                        more = await page.query_selector("text=더보기")
-                        if more:
-                            await more.click()
-                            await asyncio.sleep(1.5)
-                    except Exception:
-                        pass
-                    html = await page.content()
-                    count = html.count("mnews/article/")
-                    if count > 0 and count == last_count:
-                        stable_rounds += 1
-                        if stable_rounds >= max_stable:
-                            break
-                    else:
-                        stable_rounds = 0
-                    last_count = count
-                return await page.content()
-            finally:
-                await browser.close()
-    except Exception as e:
-        err = str(e).lower()
-        if "executable" in err or "browser" in err or "chromium" in err:
-            pass
+                await page.wait_for_selector('a[href*="mnews/article/"]', timeout=8000, state="attached")
+            except Exception:
+                pass
+            links: List[Tuple[str, str]] = [tuple(x) for x in await page.evaluate(_COLLECT_NEW_LINKS_JS)]
+            stable_rounds = 0
+            max_stable = 2
+            for _ in range(55):
+                count = len(links)
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                try:
+                    more = await page.query_selector("text=더보기")
+                    if more:
+                        await more.click()
+                except Exception:
+                    pass
+                try:
+                    # 새 기사가 DOM에 붙을 때까지 대기 (네트워크 응답 후 렌더링)
+                    await page.wait_for_function(_ARTICLE_LINK_COUNT_GREATER_JS, arg=count, timeout=2500)
+                except Exception:
+                    pass
+                links.extend(tuple(x) for x in await page.evaluate(_COLLECT_NEW_LINKS_JS))
+                if len(links) == count:
+                    stable_rounds += 1
+                    if stable_rounds >= max_stable:
+                        break
+                else:
+                    stable_rounds = 0
+            return links
+    except Exception:
         return None
 
 
 class NaverOpinionScraper(BaseScraper):
-    """네이버 오피니언 사설 — Playwright 우선(전체 로드), 미사용 시 editorial+list 보조."""
+    """네이버 오피니언 사설 — 사설 탭 첫 화면(httpx), 부족하면 Playwright(전체 로드), 그래도 부족하면 list.naver 보조."""
 
     source_name = "네이버 오피니언"
     list_url = NAVER_EDITORIAL_URL
@@ -247,6 +275,42 @@ class NaverOpinionScraper(BaseScraper):
     max_pages = 1
     max_items = 250
     LIST_NAVER_MAX_PAGES = 30
+    # list.naver 동시 요청 페이지 수: 첫 묶음은 작게 시작해 두 배씩 늘림 (대부분 1~2페이지면 끝남)
+    LIST_NAVER_FIRST_WINDOW = 2
+    LIST_NAVER_MAX_WINDOW = 6
+
+    async def _fetch_list_naver(self, client, list_type: str, param: str, date: str, seen_urls: Set[str]) -> List[Editorial]:
+        """list.naver 페이지를 묶음 단위로 동시에 받고 페이지 순서대로 파싱. 새 사설이 없는 페이지에서 중단."""
+        results: List[Editorial] = []
+        page = 1
+        window = self.LIST_NAVER_FIRST_WINDOW
+        while page <= self.LIST_NAVER_MAX_PAGES:
+            pages = range(page, min(page + window, self.LIST_NAVER_MAX_PAGES + 1))
+            responses = await asyncio.gather(*[
+                client.get(f"{NAVER_LIST_URL}?mode=LSD&mid=sec&sid1=110&listType={list_type}&date={param}&page={p}")
+                for p in pages
+            ], return_exceptions=True)
+            for r in responses:
+                try:
+                    if isinstance(r, BaseException):
+                        raise r
+                    r.raise_for_status()
+                except Exception:
+                    # 앞 페이지까지 모은 것은 살림 (순차 수집 때와 같은 동작)
+                    if results:
+                        return results
+                    raise
+                scraper_pages.inc(scraper=self.source_name)
+                # 마지막 페이지를 넘기면 네이버가 마지막 페이지를 다시 주므로 seen_urls로 걸러져 빈 결과가 됨
+                parsed = await parse_executor.run(_parse_list_naver_page, r.text, date)
+                extra = [e for e in parsed if e.url not in seen_urls]
+                if not extra:
+                    return results
+                seen_urls.update(e.url for e in extra)
+                results.extend(extra)
+            page += len(pages)
+            window = min(window * 2, self.LIST_NAVER_MAX_WINDOW)
+        return results
 
     async def fetch_editorials(self) -> List[Editorial]:
         from datetime import date
@@ -259,61 +323,66 @@ class NaverOpinionScraper(BaseScraper):
         items: List[Editorial] = []
         seen_urls: Set[str] = set()
 
-        # 1) Playwright로 사설 탭 전체 로드 시도 (실패/타임아웃 시 바로 httpx로 넘어감)
-        html = None
+        # 1) 브라우저 없이: 사설 탭 첫 화면 (나머지는 스크롤 시에만 로드되므로 20~25건 안팎)
         try:
-            html = await asyncio.wait_for(
-                _fetch_full_editorial_with_playwright(url_editorial),
-                timeout=18.0,
-            )
-        except (asyncio.TimeoutError, Exception):
-            pass
-        if html:
-            items = _parse_editorial_page_html(html, date)
-            seen_urls = {e.url for e in items}
+            async with self.http_session(
+                headers={**BROWSER_HEADERS, "Referer": url_editorial},
+                timeout=15.0,
+            ) as client:
+                r = await client.get(url_editorial)
+                r.raise_for_status()
+                scraper_pages.inc(scraper=self.source_name)
+                items = await parse_executor.run(_parse_editorial_page_html, r.text, date)
+                record_path("editorial_html", len(items))
+                seen_urls = {e.url for e in items}
+        except Exception as e:
+            print(f"[네이버 오피니언] 사설 탭 요청 실패: {e!r}")
 
-        # 2) 수집이 30개 미만이면 editorial(httpx) + list.naver 보조로 보강 (기존 항목 유지·병합)
+        # 2) 30개 미만이면 Playwright로 사설 탭 전체 로드 시도 (실패/타임아웃 시 바로 다음 단계)
         if len(items) < 30:
+            links = None
             try:
-                async with httpx.AsyncClient(
-                    follow_redirects=True,
+                links = await asyncio.wait_for(
+                    _collect_editorial_links_with_playwright(url_editorial),
+                    timeout=18.0,
+                )
+            except (asyncio.TimeoutError, Exception):
+                pass
+            if links:
+                added = 0
+                for e in _editorials_from_links(links, date):
+                    if e.url not in seen_urls:
+                        seen_urls.add(e.url)
+                        items.append(e)
+                        added += 1
+                record_path("chromium", added)
+
+        # 3) 여전히 30개 미만이면 list.naver 보조로 보강 (기존 항목 유지·병합)
+        if len(items) < 30:
+            try:
+                async with self.http_session(
                     headers={**BROWSER_HEADERS, "Referer": "https://news.naver.com/"},
                     timeout=22.0,
                 ) as client:
-                    r = await client.get(url_editorial)
-                    r.raise_for_status()
-                    extra_from_editorial = _parse_editorial_page_html(r.text, date)
-                    for e in extra_from_editorial:
-                        if e.url not in seen_urls:
-                            seen_urls.add(e.url)
-                            items.append(e)
                     # list.naver: listType=paper(신문게재) → 없으면 listType=title 시도
                     for list_type in ("paper", "title"):
-                        added_any = False
-                        for page in range(1, self.LIST_NAVER_MAX_PAGES + 1):
-                            list_url = f"{NAVER_LIST_URL}?mode=LSD&mid=sec&sid1=110&listType={list_type}&date={param}&page={page}"
-                            r2 = await client.get(list_url)
-                            r2.raise_for_status()
-                            extra = _parse_list_naver_page(r2.text, date, seen_urls)
-                            for e in extra:
-                                items.append(e)
-                                seen_urls.add(e.url)
-                                added_any = True
-                            if not extra:
-                                break
-                        if list_type == "paper" and added_any:
+                        extra = await self._fetch_list_naver(client, list_type, param, date, seen_urls)
+                        record_path(f"list_naver_{list_type}", len(extra))
+                        items.extend(extra)
+                        if list_type == "paper" and extra:
                             break
             except Exception as e:
                 if not items:
                     raise RuntimeError(f"네이버 오피니언 사설 요청 실패: {e}") from e
 
-        seen = set()
-        unique: List[Editorial] = []
-        for e in items:
-            if e.url not in seen:
-                seen.add(e.url)
-                title = (e.title or "").strip() or "제목 없음"
-                unique.append(
-                    Editorial(source=e.source, title=title, url=e.url, summary=e.summary, content=e.content, published_date=e.published_date)
-                )
+        with phase("dedup"):
+            seen = set()
+            unique: List[Editorial] = []
+            for e in items:
+                if e.url not in seen:
+                    seen.add(e.url)
+                    title = (e.title or "").strip() or "제목 없음"
+                    unique.append(
+                        Editorial(source=e.source, title=title, url=e.url, summary=e.summary, content=e.content, published_date=e.published_date)
+                    )
         return unique[: self.max_items]
@@ -2,10 +2,10 @@
 from datetime import datetime, timedelta
 from typing import List
 
-import httpx
-
 from app.models import Editorial
+from app.parse_executor import parse_executor
 from app.scrapers.base import BaseScraper, parse_rss_to_editorials, RSS_HEADERS
+from app.timings import record_path
 
 # WSJ 오피니언 공식 RSS (웹 페이지는 페이월/접근 제한)
 RSS_URL = "https://feeds.content.dowjones.io/public/rss/RSSOpinion"
@@ -20,15 +20,15 @@ class WsjScraper(BaseScraper):
 
     async def fetch_editorials(self) -> List[Editorial]:
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True,
+            async with self.http_session(
                 headers=RSS_HEADERS,
                 timeout=25.0,
             ) as client:
                 r = await client.get(RSS_URL)
                 r.raise_for_status()
-                items = parse_rss_to_editorials(r.text, self.source_name)
-                return items[: self.max_items]
+                items = (await parse_executor.run(parse_rss_to_editorials, r.text, self.source_name))[: self.max_items]
+                record_path("rss", len(items))
+                return items
         except Exception:
             return []
 
@@ -0,0 +1,88 @@
+"""스크래퍼 한 번 실행의 단계별 시간 (/api/editorials?timings=1).
+   contextvar로 기록 대상을 넘기므로 스크래퍼 함수 인자를 바꾸지 않고 httpx 훅·파싱 풀·Playwright 풀에서 바로 기록.
+   수집 중이 아니면(기록 대상이 없으면) 모든 기록 함수는 아무것도 하지 않음.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# 응답에 넣는 개별 요청 목록 최대 개수 (페이지가 많은 날짜에서 응답이 커지지 않게)
+TIMINGS_MAX_FETCHES = 50
+
+
+class ScrapeTimings:
+    """단계별 누적 시간. 동시에 받은 요청(list.naver 묶음 등)은 각각 더하므로 합이 전체 시간보다 클 수 있음."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.fetches: list[dict] = []
+        self.pages = 0
+        self.bytes = 0
+        self.paths: dict[str, int] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def to_dict(self) -> dict:
+        return {
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 1),
+            "phases_ms": {name: round(s * 1000, 1) for name, s in self.phases.items()},
+            "pages": self.pages,
+            "bytes": self.bytes,
+            # 사설을 찾아낸 경로별 건수 (chromium, editorial_html, list_naver_paper 등)
+            "paths": dict(self.paths),
+            "fetches": self.fetches[:TIMINGS_MAX_FETCHES],
+        }
+
+
+_current: ContextVar[ScrapeTimings | None] = ContextVar("scrape_timings", default=None)
+
+
+@contextmanager
+def collect():
+    """블록 안(과 그 안에서 만든 태스크)의 기록을 모을 ScrapeTimings를 yield."""
+    timings = ScrapeTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def phase(name: str):
+    """블록 실행 시간을 name 단계에 더함."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - started)
+
+
+def add_phase(name: str, seconds: float) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.add(name, seconds)
+
+
+def record_fetch(url: str, seconds: float, nbytes: int, status: int) -> None:
+    """HTTP 요청 한 번 (httpx 응답 훅에서 호출)."""
+    timings = _current.get()
+    if timings is None:
+        return
+    timings.add("fetch", seconds)
+    timings.pages += 1
+    timings.bytes += nbytes
+    timings.fetches.append({"url": url, "ms": round(seconds * 1000, 1), "bytes": nbytes, "status": status})
+
+
+def record_path(name: str, count: int) -> None:
+    """name 경로로 찾은 사설 수."""
+    timings = _current.get()
+    if timings is not None:
+        timings.paths[name] = timings.paths.get(name, 0) + count
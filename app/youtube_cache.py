@@ -0,0 +1,105 @@
+"""유튜브 구독 피드용 메모리 캐시 (TTL + stale-while-revalidate).
+   TTL 안이면 그대로, TTL이 지났어도 stale 기간 안이면 이전 값을 바로 주고 백그라운드에서 갱신.
+   같은 키를 동시에 불러오면 한 번만 호출.
+"""
+import asyncio
+import os
+import time
+from collections import OrderedDict
+
+# 사용자별 구독 채널 목록 (구독을 자주 바꾸지 않음)
+YOUTUBE_CHANNELS_TTL = int(os.environ.get("YOUTUBE_CHANNELS_TTL", "21600"))
+# 채널 → 업로드 재생목록 ID (사실상 바뀌지 않음, 모든 사용자 공유)
+YOUTUBE_UPLOADS_TTL = 7 * 24 * 3600
+# 재생목록별 최신 영상 (공개 정보라 모든 사용자 공유)
+YOUTUBE_VIDEOS_TTL = int(os.environ.get("YOUTUBE_VIDEOS_TTL", "600"))
+# TTL이 지난 뒤에도 이 시간(초) 동안은 이전 값을 주면서 백그라운드 갱신
+YOUTUBE_STALE_SECONDS = int(os.environ.get("YOUTUBE_STALE_SECONDS", "3600"))
+
+
+class SwrCache:
+    """키별 (값, 저장 시각). 항목 수가 max_entries를 넘으면 오래 안 쓴 것부터 제거."""
+
+    def __init__(self, name: str, ttl: float, stale: float = 0.0, max_entries: int = 1000):
+        self.name = name
+        self.ttl = ttl
+        self.stale = stale
+        self.max_entries = max_entries
+        self._data: OrderedDict = OrderedDict()
+        self._inflight: dict = {}
+        self._refreshing: set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def peek(self, key):
+        """TTL 안의 값만 (없으면 None). 호출 없이 조회할 때."""
+        entry = self._data.get(key)
+        if entry is None or time.monotonic() - entry[1] >= self.ttl:
+            return None
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def set(self, key, value) -> None:
+        self._data[key] = (value, time.monotonic())
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key) -> None:
+        self._data.pop(key, None)
+
+    async def get(self, key, loader, cache_if=lambda value: True):
+        """loader: 인자 없는 코루틴 함수. cache_if가 False인 결과(예: 실패로 인한 빈 목록)는 저장하지 않음."""
+        entry = self._data.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[1]
+            if age < self.ttl:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return entry[0]
+            if age < self.ttl + self.stale:
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    task = asyncio.ensure_future(self._load(key, loader, cache_if))
+                    self._refreshing.add(task)
+                    task.add_done_callback(self._refresh_done)
+                return entry[0]
+        self.misses += 1
+        return await self._load(key, loader, cache_if)
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        self._refreshing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # 백그라운드 갱신 실패: 이전 값을 계속 사용
+            print(f"[유튜브 캐시] {self.name} 갱신 실패: {task.exception()!r}")
+
+    async def _load(self, key, loader, cache_if):
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._inflight.pop(key, None))
+        value = await asyncio.shield(task)
+        if cache_if(value):
+            self.set(key, value)
+        return value
+
+    def status(self) -> dict:
+        return {
+            "entries": len(self._data),
+            "ttl_seconds": self.ttl,
+            "stale_seconds": self.stale,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+        }
+
+
+channels_cache = SwrCache("channels", YOUTUBE_CHANNELS_TTL, YOUTUBE_STALE_SECONDS, max_entries=500)
+uploads_cache = SwrCache("uploads", YOUTUBE_UPLOADS_TTL, max_entries=20000)
+videos_cache = SwrCache("videos", YOUTUBE_VIDEOS_TTL, YOUTUBE_STALE_SECONDS, max_entries=20000)
+
+
+def cache_status() -> dict:
+    return {c.name: c.status() for c in (channels_cache, uploads_cache, videos_cache)}
@@ -1,13 +1,24 @@
 """Google OAuth 및 YouTube Data API v3 연동 (구독 채널·최신 영상)."""
+import asyncio
 import os
 from urllib.parse import urlencode
 
 import httpx
 
+from app.http_clients import http_clients
+from app.metrics import youtube_api_calls, youtube_quota_units
+from app.youtube_cache import channels_cache, uploads_cache, videos_cache
+
 GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/v2/auth"
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
 YOUTUBE_API_BASE = "https://www.googleapis.com/youtube/v3"
 YOUTUBE_READONLY_SCOPE = "https://www.googleapis.com/auth/youtube.readonly"
+# Data API 호출당 할당량 단위 (목록 조회 list는 1, search는 100). 기본 일일 한도 10,000
+YOUTUBE_QUOTA_COST = {"search": 100}
+# 채널별 최신 영상(playlistItems)을 동시에 요청할 수 (googleapis.com 호스트 연결 수 이내)
+YOUTUBE_PLAYLIST_CONCURRENCY = max(1, int(os.environ.get("YOUTUBE_PLAYLIST_CONCURRENCY", "8")))
+# playlistItems 한 번의 최대 대기(초). 느린 채널 하나 때문에 피드 전체가 늦어지지 않게
+YOUTUBE_PLAYLIST_TIMEOUT = 8.0
 
 
 def get_google_oauth_url(redirect_uri: str, state: str | None = None) -> str:
@@ -33,53 +44,61 @@ async def exchange_code_for_tokens(code: str, redirect_uri: str) -> dict | None:
     if not client_id or not client_secret:
         return None
     try:
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
-                GOOGLE_TOKEN_URL,
-                data={
-                    "code": code,
-                    "client_id": client_id,
-                    "client_secret": client_secret,
-                    "redirect_uri": redirect_uri,
-                    "grant_type": "authorization_code",
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                timeout=15.0,
-            )
-            if r.status_code != 200:
-                try:
-                    err_body = r.text[:500]
-                    print(f"[유튜브] Google 토큰 교환 실패 {r.status_code}: {err_body}")
-                except Exception:
-                    pass
-                return None
-            return r.json()
-    except Exception as e:
-        print(f"[유튜브] 토큰 교환 예외: {e!r}")
-        return None
-
-
-async def refresh_access_token(refresh_token: str) -> dict | None:
-    """리프레시 토큰으로 새 액세스 토큰 발급."""
-    client_id = os.environ.get("GOOGLE_CLIENT_ID")
-    client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
-    if not client_id or not client_secret:
-        return None
-    async with httpx.AsyncClient() as client:
+        client = http_clients.get(GOOGLE_TOKEN_URL)
         r = await client.post(
             GOOGLE_TOKEN_URL,
             data={
+                "code": code,
                 "client_id": client_id,
                 "client_secret": client_secret,
-                "refresh_token": refresh_token,
-                "grant_type": "refresh_token",
+                "redirect_uri": redirect_uri,
+                "grant_type": "authorization_code",
             },
             headers={"Content-Type": "application/x-www-form-urlencoded"},
             timeout=15.0,
         )
         if r.status_code != 200:
+            try:
+                err_body = r.text[:500]
+                print(f"[유튜브] Google 토큰 교환 실패 {r.status_code}: {err_body}")
+            except Exception:
+                pass
             return None
         return r.json()
+    except Exception as e:
+        print(f"[유튜브] 토큰 교환 예외: {e!r}")
+        return None
+
+
+async def refresh_access_token(refresh_token: str) -> dict | None:
+    """리프레시 토큰으로 새 액세스 토큰 발급."""
+    client_id = os.environ.get("GOOGLE_CLIENT_ID")
+    client_secret = os.environ.get("GOOGLE_CLIENT_SECRET")
+    if not client_id or not client_secret:
+        return None
+    client = http_clients.get(GOOGLE_TOKEN_URL)
+    r = await client.post(
+        GOOGLE_TOKEN_URL,
+        data={
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "refresh_token": refresh_token,
+            "grant_type": "refresh_token",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        timeout=15.0,
+    )
+    if r.status_code != 200:
+        return None
+    return r.json()
+
+
+async def _api_get(client: httpx.AsyncClient, endpoint: str, **kwargs) -> httpx.Response:
+    """YOUTUBE_API_BASE/endpoint GET. 호출 수와 할당량 사용량을 지표에 기록."""
+    r = await client.get(f"{YOUTUBE_API_BASE}/{endpoint}", **kwargs)
+    youtube_api_calls.inc(endpoint=endpoint, status=r.status_code)
+    youtube_quota_units.inc(YOUTUBE_QUOTA_COST.get(endpoint, 1), endpoint=endpoint)
+    return r
 
 
 def _headers(access_token: str) -> dict:
@@ -98,38 +117,83 @@ async def _ensure_access_token(access_token: str, refresh_token: str | None) ->
     return None
 
 
+class _FeedToken:
+    """피드 한 번 만드는 동안 쓸 액세스 토큰. 캐시에 없어 API를 불러야 할 때 처음 한 번만 갱신(리프레시)."""
+
+    def __init__(self, access_token: str | None, refresh_token: str | None):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.new_token: str | None = None
+        self._token: str | None = None
+        self._resolved = False
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> str | None:
+        async with self._lock:
+            if not self._resolved:
+                self._token = self.access_token
+                if self.refresh_token:
+                    refreshed = await refresh_access_token(self.refresh_token)
+                    if refreshed and refreshed.get("access_token"):
+                        self._token = refreshed["access_token"]
+                        self.new_token = self._token
+                self._resolved = True
+            return self._token
+
+
+async def get_my_channel_id(access_token: str) -> str | None:
+    """로그인한 사용자의 채널 ID (캐시 키로 쓰는 사용자 식별자). 채널이 없거나 실패하면 None."""
+    if not access_token:
+        return None
+    try:
+        client = http_clients.get(YOUTUBE_API_BASE)
+        r = await _api_get(
+            client, "channels",
+            params={"part": "id", "mine": "true"},
+            headers=_headers(access_token),
+            timeout=10.0,
+        )
+        if r.status_code != 200:
+            return None
+        items = r.json().get("items", [])
+        return items[0]["id"] if items else None
+    except Exception as e:
+        print(f"[유튜브] 사용자 채널 ID 조회 실패: {e!r}")
+        return None
+
+
 async def get_subscribed_channels(access_token: str, refresh_token: str | None) -> list[dict]:
     """구독 중인 채널 목록 (채널 ID, 제목). 최대 50개."""
     token = await _ensure_access_token(access_token, refresh_token)
     if not token:
         return []
-    async with httpx.AsyncClient() as client:
-        r = await client.get(
-            f"{YOUTUBE_API_BASE}/subscriptions",
-            params={"part": "snippet", "mine": "true", "maxResults": 50},
-            headers=_headers(token),
-            timeout=15.0,
-        )
-        if r.status_code == 401 and refresh_token:
-            new_data = await refresh_access_token(refresh_token)
-            if new_data and new_data.get("access_token"):
-                r = await client.get(
-                    f"{YOUTUBE_API_BASE}/subscriptions",
-                    params={"part": "snippet", "mine": "true", "maxResults": 50},
-                    headers=_headers(new_data["access_token"]),
-                    timeout=15.0,
-                )
-        if r.status_code != 200:
-            return []
-        data = r.json()
-        items = data.get("items", [])
-        return [
-            {
-                "channel_id": it["snippet"]["resourceId"]["channelId"],
-                "title": it["snippet"]["title"],
-            }
-            for it in items
-        ]
+    client = http_clients.get(YOUTUBE_API_BASE)
+    r = await _api_get(
+        client, "subscriptions",
+        params={"part": "snippet", "mine": "true", "maxResults": 50},
+        headers=_headers(token),
+        timeout=15.0,
+    )
+    if r.status_code == 401 and refresh_token:
+        new_data = await refresh_access_token(refresh_token)
+        if new_data and new_data.get("access_token"):
+            r = await _api_get(
+                client, "subscriptions",
+                params={"part": "snippet", "mine": "true", "maxResults": 50},
+                headers=_headers(new_data["access_token"]),
+                timeout=15.0,
+            )
+    if r.status_code != 200:
+        return []
+    data = r.json()
+    items = data.get("items", [])
+    return [
+        {
+            "channel_id": it["snippet"]["resourceId"]["channelId"],
+            "title": it["snippet"]["title"],
+        }
+        for it in items
+    ]
 
 
 async def get_uploads_playlist_ids(
@@ -143,8 +207,8 @@ async def get_uploads_playlist_ids(
     # API는 한 번에 최대 50개 채널
     for i in range(0, len(channel_ids), 50):
         chunk = channel_ids[i : i + 50]
-        r = await client.get(
-            f"{YOUTUBE_API_BASE}/channels",
+        r = await _api_get(
+            client, "channels",
             params={"part": "contentDetails", "id": ",".join(chunk)},
             headers=_headers(token),
             timeout=15.0,
@@ -163,8 +227,8 @@ async def get_playlist_videos(
     client: httpx.AsyncClient, access_token: str, playlist_id: str, max_results: int = 5
 ) -> list[dict]:
     """재생목록의 최신 영상 목록."""
-    r = await client.get(
-        f"{YOUTUBE_API_BASE}/playlistItems",
+    r = await _api_get(
+        client, "playlistItems",
         params={
             "part": "snippet",
             "playlistId": playlist_id,
@@ -190,40 +254,84 @@ async def get_playlist_videos(
     ]
 
 
-async def fetch_subscription_feed(access_token: str, refresh_token: str | None) -> tuple[list[dict], list[dict], str | None]:
+async def _fetch_playlists_concurrently(
+    client: httpx.AsyncClient, auth: _FeedToken, playlist_ids: dict[str, str], channel_by_id: dict[str, dict]
+) -> list[dict]:
+    """채널별 최신 영상. 캐시(재생목록별, 사용자 공유)에 없으면 동시에(최대 YOUTUBE_PLAYLIST_CONCURRENCY개) 요청.
+    실패·시간 초과한 채널은 건너뜀."""
+    sem = asyncio.Semaphore(YOUTUBE_PLAYLIST_CONCURRENCY)
+
+    async def load(playlist_id: str) -> list[dict]:
+        async with sem:
+            token = await auth.get()
+            if not token:
+                return []
+            return await asyncio.wait_for(
+                get_playlist_videos(client, token, playlist_id, max_results=5),
+                timeout=YOUTUBE_PLAYLIST_TIMEOUT,
+            )
+
+    async def one(cid: str, playlist_id: str) -> list[dict]:
+        vids = await videos_cache.get(playlist_id, lambda: load(playlist_id), cache_if=bool)
+        title = (channel_by_id.get(cid) or {}).get("title")
+        # 캐시된 목록은 공유되므로 복사해서 채널명 보정
+        return [{**v, "channel_title": title or v.get("channel_title", "")} for v in vids]
+
+    results = await asyncio.gather(
+        *[one(cid, playlist_id) for cid, playlist_id in playlist_ids.items()], return_exceptions=True
+    )
+    all_videos = []
+    failed = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            failed += 1
+            continue
+        all_videos.extend(result)
+    if failed:
+        print(f"[유튜브] 채널 {len(results)}개 중 {failed}개 영상 목록 실패 (나머지로 피드 구성)")
+    return all_videos
+
+
+async def fetch_subscription_feed(
+    access_token: str, refresh_token: str | None, user_id: str | None = None
+) -> tuple[list[dict], list[dict], str | None]:
     """
     구독 채널 목록 + 각 채널 최신 영상 수집.
     반환: (channels, videos, new_access_token). videos는 날짜 내림차순 정렬.
     new_access_token: 리프레시로 발급된 새 토큰이 있으면 반환(세션 갱신용), 없으면 None.
+    캐시: 구독 채널은 user_id(사용자 채널 ID)별, 업로드 재생목록 ID·최신 영상은 채널·재생목록별로 공유.
+    캐시에서 모두 찾으면 Google API를 호출하지 않음 (토큰 갱신도 생략).
     """
-    channels = await get_subscribed_channels(access_token, refresh_token)
-    if not channels:
-        return [], [], None
+    auth = _FeedToken(access_token, refresh_token)
 
-    token = access_token
-    new_token = None
-    if refresh_token:
-        refreshed = await refresh_access_token(refresh_token)
-        if refreshed and refreshed.get("access_token"):
-            token = refreshed["access_token"]
-            new_token = token
-    if not token:
-        return channels, [], None
+    async def load_channels() -> list[dict]:
+        token = await auth.get()
+        return await get_subscribed_channels(token, None) if token else []
+
+    if user_id:
+        channels = await channels_cache.get(user_id, load_channels, cache_if=bool)
+    else:
+        channels = await load_channels()
+    if not channels:
+        return [], [], auth.new_token
 
     channel_ids = [c["channel_id"] for c in channels]
     # 채널당 최신 5개, 최대 30채널만 (쿼터·속도 고려)
     channel_ids = channel_ids[:30]
     channel_by_id = {c["channel_id"]: c for c in channels}
 
-    async with httpx.AsyncClient() as client:
-        playlist_ids = await get_uploads_playlist_ids(client, token, channel_ids)
-        all_videos = []
-        for cid, playlist_id in playlist_ids.items():
-            vids = await get_playlist_videos(client, token, playlist_id, max_results=5)
-            for v in vids:
-                v["channel_title"] = (channel_by_id.get(cid) or {}).get("title") or v.get("channel_title", "")
-            all_videos.extend(vids)
+    client = http_clients.get(YOUTUBE_API_BASE)
+    missing = [cid for cid in channel_ids if uploads_cache.peek(cid) is None]
+    if missing:
+        token = await auth.get()
+        if not token:
+            return channels, [], None
+        for cid, playlist_id in (await get_uploads_playlist_ids(client, token, missing)).items():
+            uploads_cache.set(cid, playlist_id)
+    playlist_ids = {cid: uploads_cache.peek(cid) for cid in channel_ids}
+    playlist_ids = {cid: pid for cid, pid in playlist_ids.items() if pid}
+    all_videos = await _fetch_playlists_concurrently(client, auth, playlist_ids, channel_by_id)
 
     # 최신순
     all_videos.sort(key=lambda x: x.get("published_at") or "", reverse=True)
-    return channels, all_videos, new_token
+    return channels, all_videos, auth.new_token
@@ -0,0 +1 @@
+# offline parser benchmarks
@@ -0,0 +1,227 @@
+"""스크래퍼 파서 오프라인 벤치마크.
+   benchmarks/fixtures의 손으로 만든(합성) 목록 HTML·RSS·기사 페이지로 각 _parse_* 함수와 parse_rss_to_editorials,
+   extract_article의 처리량(pages/s, items/s, MB/s)과 최대 메모리(tracemalloc)를 재고 JSON으로 출력.
+   네트워크·브라우저 없이 실행되므로 파서를 고친 뒤 이전 결과와 비교해 느려졌거나 추출 결과가 바뀐 것을 잡아냄.
+   픽스처는 실제 사이트에서 저장한 페이지가 아니라 각 사이트 목록·피드의 마크업 구조(링크 형식, 제목·날짜 위치,
+   메뉴·많이 본 뉴스 등 사설 외 링크)를 본떠 만든 것 → 실제 페이지보다 작고 단순하므로 처리량은 상대 비교용.
+   사이트 개편으로 파서를 고치면 해당 픽스처와 expected_items도 함께 갱신.
+
+   python -m benchmarks.parsers                          # 결과 JSON을 표준 출력으로
+   python -m benchmarks.parsers -o bench.json            # 파일로 저장
+   python -m benchmarks.parsers --baseline bench.json    # 이전 결과보다 max-slowdown 이상 느리면 종료 코드 1
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+import app.scrapers.base as base
+from app.article_bodies import extract_article
+from app.scrapers.base import parse_rss_to_editorials
+from app.scrapers.busan import _parse_busan_html
+from app.scrapers.chosun import _parse_chosun_page
+from app.scrapers.donga import _parse_donga_page
+from app.scrapers.hani import _parse_hani_html
+from app.scrapers.hankyung import _parse_hankyung_html
+from app.scrapers.joongang import _parse_joongang_html
+from app.scrapers.khan import _parse_khan_html
+from app.scrapers.kmib import _parse_kmib_html
+from app.scrapers.kookje import _parse_kookje_html
+from app.scrapers.mk import _parse_mk_html
+from app.scrapers.naver_opinion import (
+    _parse_editorial_page_html,
+    _parse_list_naver_page,
+)
+from app.scrapers.seoul import _parse_seoul_html
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+NAVER_DATE = "2026-10-16"
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    fixture: str
+    parse: object
+    # 두 번째 인자 (신문사명 또는 네이버 날짜). None이면 HTML만 넘김
+    arg: str | None
+    # 픽스처에서 나와야 하는 사설 수. 다르면 파서 동작이 바뀐 것
+    expected_items: int
+
+
+CASES = [
+    Case("naver_editorial", "naver_editorial.html", _parse_editorial_page_html, NAVER_DATE, 60),
+    Case("naver_list", "naver_list.html", _parse_list_naver_page, NAVER_DATE, 20),
+    Case("naver_article", "naver_article.html", extract_article, None, 1),
+    Case("chosun", "chosun.html", _parse_chosun_page, "조선일보", 30),
+    Case("chosun_rss", "chosun_rss.xml", parse_rss_to_editorials, "조선일보", 40),
+    Case("donga", "donga.html", _parse_donga_page, "동아일보", 24),
+    Case("donga_rss", "donga_rss.xml", parse_rss_to_editorials, "동아일보", 40),
+    Case("joongang", "joongang.html", _parse_joongang_html, "중앙일보", 24),
+    Case("hani", "hani.html", _parse_hani_html, "한겨레", 20),
+    Case("khan", "khan.html", _parse_khan_html, "경향신문", 20),
+    Case("mk", "mk.html", _parse_mk_html, "매일경제", 25),
+    Case("kmib", "kmib.html", _parse_kmib_html, "국민일보", 20),
+    Case("kookje", "kookje.html", _parse_kookje_html, "국제신문", 20),
+    Case("busan", "busan.html", _parse_busan_html, "부산일보", 30),
+    Case("hankyung", "hankyung.html", _parse_hankyung_html, "한국경제", 40),
+    Case("seoul", "seoul.html", _parse_seoul_html, "서울신문", 20),
+    Case("wsj_rss", "wsj_rss.xml", parse_rss_to_editorials, "WSJ", 30),
+]
+
+# 파서 백엔드 조합 (base.SOUP_FEATURES, base.LINK_BACKEND). 설치된 것만 비교
+BACKENDS = {
+    "lxml+selectolax": ("lxml", "selectolax", ("lxml", "selectolax.lexbor")),
+    "lxml+lxml": ("lxml", "lxml", ("lxml", "lxml.html")),
+    "html.parser+bs4": ("html.parser", "bs4", ()),
+}
+
+
+def _call(case: Case, text: str):
+    return case.parse(text) if case.arg is None else case.parse(text, case.arg)
+
+
+def _items(result) -> list:
+    """파서 결과 → 비교용 목록. 네이버 더보기는 (목록, 커서), 기사 본문은 (본문, 요약) 한 건."""
+    if isinstance(result, tuple) and isinstance(result[0], str):
+        return [result]
+    if isinstance(result, tuple):
+        result = result[0]
+    return [(e.source, e.title, e.url, e.summary, e.published_date) for e in result]
+
+
+def _use_backend(name: str) -> None:
+    base.SOUP_FEATURES, base.LINK_BACKEND, _ = BACKENDS[name]
+
+
+def _available_backends() -> list[str]:
+    return [name for name, (_, _, modules) in BACKENDS.items() if all(base._module_available(m) for m in modules)]
+
+
+def measure(case: Case, min_time: float, min_runs: int) -> dict:
+    text = (FIXTURES_DIR / case.fixture).read_text(encoding="utf-8")
+    items = _items(_call(case, text))
+
+    tracemalloc.start()
+    _call(case, text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    runs = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while runs < min_runs or elapsed < min_time:
+        _call(case, text)
+        runs += 1
+        elapsed = time.perf_counter() - started
+    per_page = elapsed / runs
+    return {
+        "name": case.name,
+        "function": case.parse.__name__,
+        "fixture": case.fixture,
+        "bytes": len(text.encode("utf-8")),
+        "items": len(items),
+        "expected_items": case.expected_items,
+        "items_ok": len(items) == case.expected_items,
+        "runs": runs,
+        "ms_per_page": round(per_page * 1000, 3),
+        "pages_per_s": round(1 / per_page, 1),
+        "items_per_s": round(len(items) / per_page, 1),
+        "mb_per_s": round(len(text.encode("utf-8")) / per_page / 1e6, 2),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def parity(case: Case, backends: list[str]) -> dict:
+    """백엔드마다 추출 결과가 기준(첫 백엔드)과 같은지."""
+    text = (FIXTURES_DIR / case.fixture).read_text(encoding="utf-8")
+    results = {}
+    for name in backends:
+        _use_backend(name)
+        results[name] = _items(_call(case, text))
+    reference = results[backends[0]]
+    return {name: items == reference for name, items in results.items()}
+
+
+def compare(results: dict, baseline: dict, max_slowdown: float) -> list[str]:
+    """기준 결과보다 max_slowdown(비율) 이상 느려진 항목·추출 수가 달라진 항목."""
+    previous = {c["name"]: c for c in baseline.get("cases", [])}
+    problems = []
+    for case in results["cases"]:
+        old = previous.get(case["name"])
+        if old is None:
+            continue
+        if case["items"] != old["items"]:
+            problems.append(f"{case['name']}: 추출 수 {old['items']} → {case['items']}")
+        if case["pages_per_s"] < old["pages_per_s"] * (1 - max_slowdown):
+            problems.append(f"{case['name']}: {old['pages_per_s']} → {case['pages_per_s']} pages/s")
+    return problems
+
+
+def run(names: list[str] | None, backend: str | None, min_time: float, min_runs: int) -> dict:
+    cases = [c for c in CASES if not names or c.name in names]
+    backends = _available_backends()
+    default = (base.SOUP_FEATURES, base.LINK_BACKEND)
+    if backend:
+        if backend not in backends:
+            raise SystemExit(f"사용할 수 없는 백엔드: {backend} (설치됨: {', '.join(backends)})")
+        _use_backend(backend)
+    measured = [measure(c, min_time, min_runs) for c in cases]
+    used = (base.SOUP_FEATURES, base.LINK_BACKEND)
+    if len(backends) > 1:
+        for case, result in zip(cases, measured):
+            result["parity"] = parity(case, backends)
+    base.SOUP_FEATURES, base.LINK_BACKEND = default
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "soup_features": used[0],
+        "link_backend": used[1],
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "cases": measured,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="스크래퍼 파서 오프라인 벤치마크")
+    parser.add_argument("cases", nargs="*", help=f"실행할 항목 (기본: 전체). {', '.join(c.name for c in CASES)}")
+    parser.add_argument("-o", "--output", help="결과 JSON 저장 경로 (기본: 표준 출력)")
+    parser.add_argument("--backend", choices=list(BACKENDS), help="측정에 쓸 파서 백엔드 (기본: HTML_PARSER 설정)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="항목당 최소 측정 시간(초)")
+    parser.add_argument("--min-runs", type=int, default=5, help="항목당 최소 반복 횟수")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-slowdown", type=float, default=0.25, help="허용하는 처리량 감소 비율 (기본 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run(args.cases, args.backend, args.min_time, args.min_runs)
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    for case in results["cases"]:
+        flags = "" if case["items_ok"] else f"  추출 수 {case['items']} (예상 {case['expected_items']})"
+        if not all(case.get("parity", {}).values()):
+            flags += f"  백엔드 불일치 {case['parity']}"
+        print(
+            f"[벤치마크] {case['name']:<22}{case['pages_per_s']:>10} pages/s{case['items_per_s']:>12} items/s"
+            f"{case['peak_kib']:>10} KiB{flags}",
+            file=sys.stderr,
+        )
+
+    failed = [c["name"] for c in results["cases"] if not c["items_ok"]]
+    if args.baseline:
+        problems = compare(results, json.loads(Path(args.baseline).read_text(encoding="utf-8")), args.max_slowdown)
+        for p in problems:
+            print(f"[벤치마크] 회귀: {p}", file=sys.stderr)
+        failed.extend(problems)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
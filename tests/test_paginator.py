@@ -0,0 +1,105 @@
+"""최신순 목록 공통 페이지네이터(BaseScraper.paginate_for_date)가 읽는 쪽 수와 실패한 쪽 처리."""
+import asyncio
+from datetime import date, timedelta
+from typing import List
+
+import httpx
+
+from app.models import Editorial
+from app.scrapers.base import BaseScraper
+
+NEWEST = date(2026, 10, 16)
+
+
+class FakeListScraper(BaseScraper):
+    """하루 items_per_day건, 한 쪽 page_size건씩 최신순으로 싣는 가짜 목록. 요청한 쪽 번호를 requests에 기록."""
+
+    source_name = "테스트"
+    list_url = "https://list.example/editorials"
+    newest_first = True
+    page_retry_delay = 0.0
+
+    def __init__(self, days: int, items_per_day: int = 5, page_size: int = 10, max_pages: int = 40, fail=None):
+        self.items = [
+            (NEWEST - timedelta(days=d)).isoformat() for d in range(days) for _ in range(items_per_day)
+        ]
+        self.page_size = page_size
+        self.max_pages = max_pages
+        # 쪽 번호 → 실패로 응답할 횟수 (None이면 계속 실패)
+        self.fail = dict(fail or {})
+        self.requests: List[int] = []
+        super().__init__(client=httpx.AsyncClient(transport=httpx.MockTransport(self._handle)))
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        self.requests.append(page)
+        remaining = self.fail.get(page, 0)
+        if remaining is None or remaining > 0:
+            if remaining:
+                self.fail[page] = remaining - 1
+            return httpx.Response(503)
+        return httpx.Response(200, text=f"page={page}")
+
+    def parse_page(self, html: str) -> List[Editorial]:
+        page = int(html.split("=")[1])
+        start = (page - 1) * self.page_size
+        return [
+            Editorial(self.source_name, f"사설 {i}", f"https://list.example/{i}", None, None, published)
+            for i, published in enumerate(self.items[start:start + self.page_size], start)
+        ]
+
+    async def fetch_editorials(self) -> List[Editorial]:
+        return await self.fetch_list_pages()
+
+    def expected(self, target: str) -> List[str]:
+        return [f"https://list.example/{i}" for i, published in enumerate(self.items) if published == target]
+
+
+def _run(scraper: FakeListScraper, target: date) -> List[str]:
+    return [e.url for e in asyncio.run(scraper.paginate_for_date(target.isoformat()))]
+
+
+def test_past_date_reads_fewer_pages_than_sequential_walk():
+    scraper = FakeListScraper(days=200)
+    target = NEWEST - timedelta(days=20)
+    assert _run(scraper, target) == scraper.expected(target.isoformat())
+    # 20일 전(하루 5건, 한 쪽 10건) → 11쪽. 차례로 읽으면 11쪽, 추정·이분 탐색은 그보다 훨씬 적게
+    assert len(set(scraper.requests)) <= 4, scraper.requests
+
+
+def test_page_count_stays_logarithmic_when_estimate_is_off():
+    # 1쪽이 하루치라 한 쪽당 일수를 1일로 추정하지만 실제로는 한 쪽에 0.5일 → 추정이 크게 빗나감
+    scraper = FakeListScraper(days=200, items_per_day=20, page_size=10, max_pages=120)
+    target = NEWEST - timedelta(days=40)
+    assert _run(scraper, target) == scraper.expected(target.isoformat())
+    # 정답 81~82쪽: 차례로 읽으면 82쪽
+    assert len(set(scraper.requests)) <= 8, scraper.requests
+
+
+def test_recent_date_on_first_page_reads_one_or_two_pages():
+    scraper = FakeListScraper(days=200)
+    assert _run(scraper, NEWEST) == scraper.expected(NEWEST.isoformat())
+    assert len(set(scraper.requests)) <= 2, scraper.requests
+
+
+def test_missing_date_stops_quickly():
+    scraper = FakeListScraper(days=10)
+    assert _run(scraper, NEWEST - timedelta(days=60)) == []
+    assert len(set(scraper.requests)) <= 8, scraper.requests
+
+
+def test_transient_failure_is_retried():
+    target = NEWEST - timedelta(days=20)
+    scraper = FakeListScraper(days=200, fail={11: 1})
+    assert _run(scraper, target) == scraper.expected(target.isoformat())
+    assert scraper.requests.count(11) == 2
+
+
+def test_failed_page_does_not_hide_target_date():
+    # 하루 4건이라 22일 전 사설은 9쪽(2건)과 10쪽(2건)에 걸침. 추정한 9쪽이 계속 실패해도
+    # 그 쪽을 '전부 더 과거'로 보지 않고 이웃 쪽을 읽어 10쪽의 사설은 찾음
+    target = NEWEST - timedelta(days=22)
+    scraper = FakeListScraper(days=200, items_per_day=4, fail={9: None})
+    expected = scraper.expected(target.isoformat())
+    assert _run(scraper, target) == expected[2:]
+    assert 10 in scraper.requests
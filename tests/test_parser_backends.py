@@ -0,0 +1,98 @@
+"""HTML 파서 백엔드(html.parser, lxml, selectolax)마다 스크래퍼 파서의 Editorial 결과가 같은지.
+   benchmarks/fixtures의 목록 페이지를 순수 파이썬 html.parser 결과와 비교 (설치되지 않은 백엔드는 건너뜀).
+   픽스처는 실제 페이지를 저장한 것이 아니라 마크업 구조를 본떠 손으로 만든 합성 페이지라, 실제 사이트의
+   깨진 마크업·인코딩 차이에서 백엔드 결과가 갈리는 경우까지 잡아내지는 못함."""
+from pathlib import Path
+
+import pytest
+
+import app.scrapers.base as base
+from app.scrapers.busan import _parse_busan_html
+from app.scrapers.chosun import _parse_chosun_page
+from app.scrapers.donga import _parse_donga_page
+from app.scrapers.hani import _parse_hani_html
+from app.scrapers.hankyung import _parse_hankyung_html
+from app.scrapers.joongang import _parse_joongang_html
+from app.scrapers.khan import _parse_khan_html
+from app.scrapers.kmib import _parse_kmib_html
+from app.scrapers.kookje import _parse_kookje_html
+from app.scrapers.mk import _parse_mk_html
+from app.scrapers.naver_opinion import _parse_editorial_page_html, _parse_list_naver_page
+from app.scrapers.seoul import _parse_seoul_html
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+NAVER_DATE = "2026-10-16"
+
+# (픽스처, 파서, 두 번째 인자)
+LIST_PAGES = [
+    ("naver_editorial.html", _parse_editorial_page_html, NAVER_DATE),
+    ("naver_list.html", _parse_list_naver_page, NAVER_DATE),
+    ("chosun.html", _parse_chosun_page, "조선일보"),
+    ("donga.html", _parse_donga_page, "동아일보"),
+    ("joongang.html", _parse_joongang_html, "중앙일보"),
+    ("hani.html", _parse_hani_html, "한겨레"),
+    ("khan.html", _parse_khan_html, "경향신문"),
+    ("mk.html", _parse_mk_html, "매일경제"),
+    ("kmib.html", _parse_kmib_html, "국민일보"),
+    ("kookje.html", _parse_kookje_html, "국제신문"),
+    ("busan.html", _parse_busan_html, "부산일보"),
+    ("hankyung.html", _parse_hankyung_html, "한국경제"),
+    ("seoul.html", _parse_seoul_html, "서울신문"),
+]
+
+# (SOUP_FEATURES, LINK_BACKEND, 필요한 모듈)
+BACKENDS = {
+    "lxml": ("lxml", "lxml", ("lxml", "lxml.html")),
+    "selectolax": ("lxml", "selectolax", ("lxml", "selectolax.lexbor")),
+}
+
+
+def _use(monkeypatch, features: str, link_backend: str) -> None:
+    monkeypatch.setattr(base, "SOUP_FEATURES", features)
+    monkeypatch.setattr(base, "LINK_BACKEND", link_backend)
+
+
+def _editorials(parse, html: str, arg: str) -> list[tuple]:
+    return [(e.source, e.title, e.url, e.summary, e.content, e.published_date) for e in parse(html, arg)]
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+@pytest.mark.parametrize("fixture,parse,arg", LIST_PAGES, ids=[p[0] for p in LIST_PAGES])
+def test_list_page_parity(monkeypatch, backend, fixture, parse, arg):
+    features, link_backend, modules = BACKENDS[backend]
+    for module in modules:
+        pytest.importorskip(module)
+    html = (FIXTURES_DIR / fixture).read_text(encoding="utf-8")
+
+    _use(monkeypatch, "html.parser", "bs4")
+    expected = _editorials(parse, html, arg)
+    _use(monkeypatch, features, link_backend)
+    actual = _editorials(parse, html, arg)
+
+    assert expected, f"{fixture}: html.parser에서 사설을 하나도 찾지 못함"
+    assert actual == expected
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+@pytest.mark.parametrize("fixture", [p[0] for p in LIST_PAGES])
+def test_iter_links_parity(monkeypatch, backend, fixture):
+    _, link_backend, modules = BACKENDS[backend]
+    for module in modules:
+        pytest.importorskip(module)
+    html = (FIXTURES_DIR / fixture).read_text(encoding="utf-8")
+
+    _use(monkeypatch, "html.parser", "bs4")
+    expected = list(base.iter_links(html))
+    _use(monkeypatch, "html.parser", link_backend)
+    assert list(base.iter_links(html)) == expected
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_iter_links_empty_and_xml_declaration(monkeypatch, backend):
+    _, link_backend, modules = BACKENDS[backend]
+    for module in modules:
+        pytest.importorskip(module)
+    _use(monkeypatch, "html.parser", link_backend)
+    assert list(base.iter_links("")) == []
+    html = '<?xml version="1.0" encoding="utf-8"?><html><body><a href="/a"> 사설 <b>제목</b> </a></body></html>'
+    assert list(base.iter_links(html)) == [("/a", "사설제목")]
@@ -0,0 +1,68 @@
+"""저장된 사설 전문 검색(search_editorials): trigram 색인이 못 찾는 2글자 검색어도 bigram 색인으로 순위가 매겨지는지."""
+import asyncio
+
+import aiosqlite
+import pytest
+
+import app.database as database
+from app.database import init_db, save_article_body, save_editorials, search_editorials
+from app.models import Editorial
+
+DATE = "2026-10-16"
+
+EDITORIALS = [
+    Editorial("가신문", "[사설] 검찰 개혁, 더 미룰 수 없다", "https://a.example/1", None, None, DATE),
+    Editorial("나신문", "[사설] 반도체 지원법 처리 서둘러야", "https://b.example/2", "검찰 수사와는 별개로", None, DATE),
+    Editorial("다신문", "[사설] 물가 안정이 먼저다", "https://c.example/3", None, None, DATE),
+] + [
+    # bm25의 IDF가 0에 가깝지 않도록 검색어가 없는 사설을 더 둠
+    Editorial("라신문", f"[사설] 지역 균형 발전 {i}", f"https://d.example/{i}", None, None, DATE)
+    for i in range(8)
+]
+
+
+@pytest.fixture(autouse=True)
+def trigram(monkeypatch):
+    monkeypatch.setattr(database, "FTS_TOKENIZER", "trigram")
+    monkeypatch.setattr(database, "FTS_MIN_TERM_LENGTH", 3)
+
+
+def _search(query: str, body: str | None = None) -> tuple[int, list[dict]]:
+    async def run():
+        async with aiosqlite.connect(":memory:") as db:
+            await init_db(db)
+            await save_editorials(db, "테스트", DATE, EDITORIALS)
+            if body:
+                await save_article_body(db, "https://c.example/3", body, None)
+            return await search_editorials(db, query)
+
+    return asyncio.run(run())
+
+
+def test_two_syllable_query_is_ranked():
+    total, results = _search("검찰")
+    assert total == 2
+    assert all(r["score"] is not None for r in results)
+    # 제목에서 찾은 사설이 요약에서만 찾은 사설보다 앞
+    assert [r["url"] for r in results] == ["https://a.example/1", "https://b.example/2"]
+    assert results[0]["score"] > results[1]["score"]
+
+
+def test_two_syllable_query_matches_inside_longer_word_and_body():
+    total, results = _search("안정", body="검찰개혁보다 물가안정이 시급하다")
+    assert total == 1 and results[0]["url"] == "https://c.example/3"
+    # 본문을 나중에 받아도 색인에 반영됨
+    total, results = _search("찰개", body="검찰개혁보다 물가안정이 시급하다")
+    assert total == 1 and results[0]["score"] is not None
+
+
+def test_bigram_does_not_cross_word_boundary():
+    # '개혁, 더'의 '혁'과 '더'는 다른 어절
+    assert _search("혁더")[0] == 0
+
+
+def test_mixed_terms_combine_trigram_and_bigram():
+    # '반도체'는 trigram 색인, '검찰'은 bigram 색인 → 둘 다 들어 있는 사설만
+    total, results = _search("반도체 검찰")
+    assert total == 1 and results[0]["url"] == "https://b.example/2"
+    assert results[0]["score"] is not None